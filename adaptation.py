@@ -0,0 +1,262 @@
+"""
+Adaptive difficulty engine
+
+A policy decides, after every answer, the next difficulty level, the answer
+status (CLEARED / WARNING / TERMINATED) and whether the interview can stop
+early because a hiring decision has been reached. Policies are registered in
+POLICIES and picked by name (ADAPTATION_POLICY env var in app.py).
+
+- StepPolicy: the original rule - one level up at >= 70, one level down
+  below 50, terminate after 3 consecutive fails. Never stops early.
+- EloPolicy: IRT/Elo-style ability estimate. Each level is an item of fixed
+  difficulty; the candidate's ability (mean + variance) is updated after each
+  answer with a Kalman step on the logistic expected score, the next level is
+  the most informative one, and the interview stops as soon as the ability is
+  confidently above or below the pass cut.
+
+Every policy has a scalar `update(session, score)` used per request and a
+NumPy `update_batch(state, scores)` used by `simulate()` to replay thousands
+of score sequences at once.
+"""
+import math
+from typing import NamedTuple
+
+from models import Difficulty
+
+
+class Decision(NamedTuple):
+    difficulty: Difficulty
+    status: str          # 'CLEARED' | 'WARNING' | 'TERMINATED'
+    fail_streak: int
+    decided: bool        # True when the interview can stop now
+
+
+class StepPolicy:
+    """Original three-level step rule"""
+
+    def __init__(self, up_threshold=70, down_threshold=50, fail_threshold=3):
+        self.up_threshold = up_threshold
+        self.down_threshold = down_threshold
+        self.fail_threshold = fail_threshold
+
+    def update(self, session, score):
+        current = session.difficulty
+        fail_streak = session.fail_streak + 1 if score < self.down_threshold else 0
+
+        if fail_streak >= self.fail_threshold:
+            return Decision(current, 'TERMINATED', fail_streak, True)
+
+        if score >= self.up_threshold and current < Difficulty.HARD:
+            return Decision(Difficulty(current + 1), 'CLEARED', fail_streak, False)
+        if score < self.down_threshold and current > Difficulty.EASY:
+            return Decision(Difficulty(current - 1), 'WARNING', fail_streak, False)
+
+        status = 'CLEARED' if score >= self.down_threshold else 'WARNING'
+        return Decision(current, status, fail_streak, False)
+
+    def update_batch(self, state, scores):
+        """Vectorized update; returns (terminated, decided_pass) boolean arrays"""
+        import numpy as np
+
+        failed = scores < self.down_threshold
+        state['fail_streak'] = np.where(failed, state['fail_streak'] + 1, 0)
+        terminated = state['fail_streak'] >= self.fail_threshold
+
+        step = np.where(scores >= self.up_threshold, 1, np.where(failed, -1, 0))
+        next_level = np.clip(state['difficulty'] + step, Difficulty.EASY, Difficulty.HARD)
+        state['difficulty'] = np.where(terminated, state['difficulty'], next_level)
+        return terminated, np.zeros_like(terminated)
+
+
+class EloPolicy:
+    """IRT/Elo-style ability estimate with confidence-based early stopping"""
+
+    def __init__(self, item_difficulty=(-1.0, 0.0, 1.0), discrimination=1.5,
+                 score_noise=15.0, prior_mean=0.0, prior_var=1.0,
+                 pass_ability=0.0, confidence_z=1.645, min_questions=3,
+                 down_threshold=50):
+        self.item_difficulty = tuple(item_difficulty)
+        self.discrimination = discrimination
+        self.noise_var = (score_noise / 100.0) ** 2
+        self.prior_mean = prior_mean
+        self.prior_var = prior_var
+        self.pass_ability = pass_ability
+        self.confidence_z = confidence_z
+        self.min_questions = min_questions
+        self.down_threshold = down_threshold
+
+    def _closest_level(self, ability):
+        return Difficulty(min(range(len(self.item_difficulty)),
+                              key=lambda level: abs(self.item_difficulty[level] - ability)))
+
+    def update(self, session, score):
+        if session.ability_var is None:
+            session.ability, session.ability_var = self.prior_mean, self.prior_var
+
+        a = self.discrimination
+        expected = 1.0 / (1.0 + math.exp(-a * (session.ability - self.item_difficulty[session.difficulty])))
+        slope = a * expected * (1.0 - expected)
+
+        # Kalman step on y = expected(ability) + noise
+        posterior_var = 1.0 / (1.0 / session.ability_var + slope * slope / self.noise_var)
+        session.ability += posterior_var * slope / self.noise_var * (score / 100.0 - expected)
+        session.ability_var = posterior_var
+
+        fail_streak = session.fail_streak + 1 if score < self.down_threshold else 0
+        status = 'CLEARED' if score >= self.down_threshold else 'WARNING'
+        next_difficulty = self._closest_level(session.ability)
+
+        # question_count already includes this answer
+        if session.question_count >= self.min_questions:
+            margin = self.confidence_z * math.sqrt(posterior_var)
+            if session.ability + margin < self.pass_ability:
+                return Decision(session.difficulty, 'TERMINATED', fail_streak, True)
+            if session.ability - margin > self.pass_ability:
+                return Decision(next_difficulty, status, fail_streak, True)
+
+        return Decision(next_difficulty, status, fail_streak, False)
+
+    def update_batch(self, state, scores):
+        """Vectorized update; returns (terminated, decided_pass) boolean arrays"""
+        import numpy as np
+
+        items = np.asarray(self.item_difficulty)
+        a = self.discrimination
+        expected = 1.0 / (1.0 + np.exp(-a * (state['ability'] - items[state['difficulty']])))
+        slope = a * expected * (1.0 - expected)
+
+        posterior_var = 1.0 / (1.0 / state['ability_var'] + slope * slope / self.noise_var)
+        state['ability'] = state['ability'] + posterior_var * slope / self.noise_var * (scores / 100.0 - expected)
+        state['ability_var'] = posterior_var
+
+        failed = scores < self.down_threshold
+        state['fail_streak'] = np.where(failed, state['fail_streak'] + 1, 0)
+
+        margin = self.confidence_z * np.sqrt(posterior_var)
+        ready = state['count'] >= self.min_questions
+        terminated = ready & (state['ability'] + margin < self.pass_ability)
+        decided_pass = ready & (state['ability'] - margin > self.pass_ability)
+
+        next_level = np.abs(items[None, :] - state['ability'][:, None]).argmin(axis=1)
+        state['difficulty'] = np.where(terminated, state['difficulty'], next_level)
+        return terminated, decided_pass
+
+
+POLICIES = {
+    'step': StepPolicy,
+    'elo': EloPolicy,
+}
+
+
+def get_policy(name, **kwargs):
+    """Build a registered adaptation policy by name"""
+    try:
+        return POLICIES[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown adaptation policy '{name}'. Available: {', '.join(POLICIES)}")
+
+
+# ======================
+# BATCH SIMULATION
+# ======================
+
+def synthetic_responder(abilities, item_difficulty=(-1.0, 0.0, 1.0), discrimination=1.5,
+                        score_noise=15.0, rng=None):
+    """
+    Build a score function for synthetic candidates of known ability
+
+    Returns:
+        callable(difficulty_array, question_index, rows) -> score array (0-100)
+    """
+    import numpy as np
+
+    rng = rng if rng is not None else np.random.default_rng()
+    items = np.asarray(item_difficulty)
+
+    def respond(difficulty, question_index, rows):
+        expected = 100.0 / (1.0 + np.exp(-discrimination * (abilities[rows] - items[difficulty])))
+        return np.clip(expected + rng.normal(0.0, score_noise, size=len(rows)), 0.0, 100.0)
+
+    return respond
+
+
+def archived_responder(score_sequences):
+    """
+    Build a score function that replays archived score sequences
+
+    Sequences shorter than the interview are padded with their last score.
+    Archived scores were produced at whatever level the old policy chose, so
+    replaying them under another policy ignores the level - good enough to
+    compare stopping rules, not to compare level choices.
+    """
+    import numpy as np
+
+    width = max(len(seq) for seq in score_sequences)
+    matrix = np.array([list(seq) + [seq[-1]] * (width - len(seq)) for seq in score_sequences], dtype=float)
+
+    def respond(difficulty, question_index, rows):
+        return matrix[rows, min(question_index, width - 1)]
+
+    return respond
+
+
+def simulate(policy, responder, n_sessions, max_questions=10, pass_score=60.0):
+    """
+    Replay n_sessions interviews under `policy`, vectorized across sessions
+
+    Args:
+        policy: An adaptation policy (see POLICIES)
+        responder: Score function from synthetic_responder / archived_responder
+        n_sessions: Number of interviews to simulate
+        max_questions: Interview length cap (MAX_QUESTIONS)
+        pass_score: Average score counted as a pass when the cap is reached
+
+    Returns:
+        dict: per-session 'questions' and 'passed' arrays plus summary stats
+    """
+    import numpy as np
+
+    prior_mean = getattr(policy, 'prior_mean', 0.0)
+    prior_var = getattr(policy, 'prior_var', 1.0)
+    state = {
+        'difficulty': np.full(n_sessions, int(Difficulty.EASY)),
+        'fail_streak': np.zeros(n_sessions, dtype=int),
+        'ability': np.full(n_sessions, prior_mean),
+        'ability_var': np.full(n_sessions, prior_var),
+        'count': np.zeros(n_sessions, dtype=int),
+    }
+    score_sum = np.zeros(n_sessions)
+    questions = np.full(n_sessions, max_questions)
+    passed = np.zeros(n_sessions, dtype=bool)
+    early = np.zeros(n_sessions, dtype=bool)
+    active = np.arange(n_sessions)
+
+    for question_index in range(max_questions):
+        if active.size == 0:
+            break
+        sub = {key: value[active] for key, value in state.items()}
+        scores = responder(sub['difficulty'], question_index, active)
+        sub['count'] = sub['count'] + 1
+        score_sum[active] += scores
+
+        terminated, decided_pass = policy.update_batch(sub, scores)
+        for key, value in sub.items():
+            state[key][active] = value
+
+        stopped = terminated | decided_pass
+        questions[active[stopped]] = question_index + 1
+        passed[active[decided_pass]] = True
+        early[active[stopped]] = True
+        active = active[~stopped]
+
+    # Interviews that hit the cap are judged on their average score
+    passed[active] = score_sum[active] / max_questions >= pass_score
+
+    return {
+        'questions': questions,
+        'passed': passed,
+        'mean_questions': float(questions.mean()),
+        'median_questions': float(np.median(questions)),
+        'early_stop_rate': float(early.mean()),
+        'pass_rate': float(passed.mean()),
+    }
@@ -1,13 +1,29 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, has_request_context
 from flask_cors import CORS
-from datetime import datetime
+from werkzeug.middleware.proxy_fix import ProxyFix
 import json
+import time
 import os
 from dotenv import load_dotenv
 import uuid
-import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from groq import Groq
+import atexit
+import dataclasses
+import functools
+import hashlib
+import importlib
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from models import Difficulty, Status, InterviewSession, InterviewResponse
+from adaptation import get_policy
+from dedup import QuestionDeduplicator, QuestionIndex
+from ingestion import IngestionPipeline, SUPPORTED_EXTENSIONS, store_stream, expand_zip
+from skills import SkillMatcher, load_taxonomy, skill_overlap
+from search import CandidateIndex
+from scheduler import (DEFAULT_CLASS_LIMITS, LLMScheduler, SchedulerRejected, TrafficClass, parse_tenant_keys,
+                       parse_weights)
 
 # Load environment variables
 load_dotenv()
@@ -16,39 +32,226 @@ load_dotenv()
 app = Flask(__name__, static_folder='frontend/dist', static_url_path='')
 CORS(app)
 
+# Behind a reverse proxy (Render sets RENDER=true) remote_addr is the proxy's
+# address; trust that many X-Forwarded-For hops for the real client address
+TRUSTED_PROXY_HOPS = int(os.getenv('TRUSTED_PROXY_HOPS', 1 if os.getenv('RENDER') else 0))
+if TRUSTED_PROXY_HOPS:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_HOPS)
+
 # Configure Groq API
 groq_api_key = os.getenv('GROQ_API_KEY')
 if not groq_api_key:
     raise ValueError('GROQ_API_KEY environment variable is not set')
 
-# Initialize Groq client
-groq_client = Groq(api_key=groq_api_key)
+# Startup configuration
+# Heavy modules (numpy, scikit-learn, groq) are imported on first use so worker
+# boot stays fast. Set PRELOAD_HEAVY_MODULES=1 together with gunicorn's
+# preload_app to import them once in the master and share them with workers.
+PRELOAD_HEAVY_MODULES = os.getenv('PRELOAD_HEAVY_MODULES', 'false').lower() in ('1', 'true', 'yes')
+SIMILARITY_BACKEND = os.getenv('SIMILARITY_BACKEND', 'numpy').lower()  # 'numpy' or 'sklearn'
+HEAVY_MODULES = ['numpy', 'groq']
+
+# Groq client is created lazily, once per process (see get_groq_client)
+groq_client = None
+_groq_client_pid = None
+_groq_client_lock = threading.Lock()
 
 # In-memory storage (replace with Firebase in production)
-sessions = {}
-candidate_profiles = {}
-interview_responses = {}
+sessions = {}              # session_id -> InterviewSession
+# Candidate profiles (candidate_id -> profile) live in candidate_index - see below
+interview_responses = {}   # session_id -> [InterviewResponse]
+question_indices = {}      # session_id -> QuestionIndex (asked-question signatures + covered topics)
 
 # Constants
-DIFFICULTY_LEVELS = ['EASY', 'MEDIUM', 'HARD']
 TIME_LIMITS = {
-    'EASY': 90,
-    'MEDIUM': 120,
-    'HARD': 180
+    Difficulty.EASY: 90,
+    Difficulty.MEDIUM: 120,
+    Difficulty.HARD: 180
 }
 MAX_QUESTIONS = 10
+MAX_QUESTION_ATTEMPTS = 3  # generations per question before accepting a near-duplicate
 FAIL_THRESHOLD = 3
 SCORE_THRESHOLD_UP = 70
 SCORE_THRESHOLD_DOWN = 50
 
+# Adaptation policy: 'step' (original threshold rule) or 'elo' (ability
+# estimate with early stopping once the pass/fail decision is confident)
+ADAPTATION_POLICY = os.getenv('ADAPTATION_POLICY', 'step').lower()
+ADAPTATION_POLICY_OPTIONS = {
+    'step': {
+        'up_threshold': SCORE_THRESHOLD_UP,
+        'down_threshold': SCORE_THRESHOLD_DOWN,
+        'fail_threshold': FAIL_THRESHOLD
+    },
+    'elo': {
+        'down_threshold': SCORE_THRESHOLD_DOWN
+    }
+}
+adaptation_policy = get_policy(ADAPTATION_POLICY, **ADAPTATION_POLICY_OPTIONS.get(ADAPTATION_POLICY, {}))
+
+# Near-duplicate question detection (per session and across the domain)
+question_deduplicator = QuestionDeduplicator(
+    session_threshold=float(os.getenv('QUESTION_DUP_THRESHOLD', 0.5)),
+    domain_repeat_limit=int(os.getenv('QUESTION_DOMAIN_REPEAT_LIMIT', 3))
+)
+
+# Resume upload ingestion
+UPLOAD_DIR = os.getenv('UPLOAD_DIR', os.path.join(tempfile.gettempdir(), 'buildxhire-uploads'))
+RESUME_CACHE_DIR = os.getenv('RESUME_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'buildxhire-resume-cache'))
+MAX_UPLOAD_MB = int(os.getenv('MAX_UPLOAD_MB', 50))
+MAX_RESUME_FILE_MB = int(os.getenv('MAX_RESUME_FILE_MB', 10))
+MAX_BULK_FILES = int(os.getenv('MAX_BULK_FILES', 200))
+MAX_RESUME_CHARS = int(os.getenv('MAX_RESUME_CHARS', 20000))  # prompt budget per resume
+BULK_ANALYZE_WORKERS = int(os.getenv('BULK_ANALYZE_WORKERS', 4))
+
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_MB * 1024 * 1024
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+ingestion_pipeline = IngestionPipeline(
+    cache_dir=RESUME_CACHE_DIR,
+    max_workers=int(os.getenv('INGEST_WORKERS', 0)) or None,
+    max_chars=MAX_RESUME_CHARS,
+    cache_max_bytes=int(os.getenv('RESUME_CACHE_MAX_MB', 200)) * 1024 * 1024,
+    cache_max_age=float(os.getenv('RESUME_CACHE_MAX_AGE_HOURS', 168)) * 3600,
+    extract_timeout=float(os.getenv('RESUME_EXTRACT_TIMEOUT', 60))
+)
+atexit.register(ingestion_pipeline.shutdown)
+
+# Skill taxonomy matcher (built-in taxonomy, optionally extended from a JSON file)
+skill_matcher = SkillMatcher(load_taxonomy(os.getenv('SKILL_TAXONOMY_PATH')))
+
+# Candidate search index, persisted as an append-only log that is replayed on
+# first use. It also stores the profiles themselves, so they survive restarts.
+# Relative paths resolve against the app directory, not the working directory.
+CANDIDATE_INDEX_PATH = os.getenv('CANDIDATE_INDEX_PATH', os.path.join('data', 'candidate_index.jsonl'))
+CANDIDATE_RETENTION_DAYS = float(os.getenv('CANDIDATE_RETENTION_DAYS', 0))
+MAX_SEARCH_RESULTS = 100
+candidate_index = CandidateIndex(
+    skill_matcher,
+    path=os.path.join(app.root_path, CANDIDATE_INDEX_PATH) if CANDIDATE_INDEX_PATH else None,
+    max_age=CANDIDATE_RETENTION_DAYS * 86400 or None
+)
+
 # Groq model to use - llama3-70b is very capable and fast
 GROQ_MODEL = "llama-3.3-70b-versatile"  # or "mixtral-8x7b-32768" or "llama-3.1-70b-versatile"
 
+# A queued LLM call holds its request thread. Resume tools may use at most
+# NON_LIVE_REQUEST_THREADS of a worker's threads (GUNICORN_THREADS, as in
+# gunicorn.conf.py) and get a 429 at once beyond that; the rest stay free for
+# interview requests. The non-live queues are sized to fit in that budget:
+# each bulk upload holds one thread and queues up to BULK_ANALYZE_WORKERS calls.
+REQUEST_THREADS = int(os.getenv('GUNICORN_THREADS', 16))
+NON_LIVE_REQUEST_THREADS = max(1, REQUEST_THREADS - max(1, REQUEST_THREADS // 4))
+non_live_requests = threading.BoundedSemaphore(NON_LIVE_REQUEST_THREADS)
+LLM_CLASS_LIMITS = {
+    TrafficClass.INTERACTIVE: dataclasses.replace(DEFAULT_CLASS_LIMITS[TrafficClass.INTERACTIVE],
+                                                  max_queue=NON_LIVE_REQUEST_THREADS),
+    TrafficClass.BATCH: dataclasses.replace(DEFAULT_CLASS_LIMITS[TrafficClass.BATCH],
+                                            max_queue=NON_LIVE_REQUEST_THREADS * BULK_ANALYZE_WORKERS),
+}
+
+# LLM call scheduling: live interview > interactive resume tools > batch, with
+# weighted fair sharing between tenants inside each class (per worker process)
+llm_scheduler = LLMScheduler(
+    max_concurrency=int(os.getenv('LLM_MAX_CONCURRENCY', 8)),
+    class_limits=LLM_CLASS_LIMITS,
+    tenant_weights=parse_weights(os.getenv('LLM_TENANT_WEIGHTS', '')),
+    tenant_quota_per_minute=int(os.getenv('LLM_TENANT_QUOTA_PER_MINUTE', 0)),
+    reserved_live=int(os.environ['LLM_RESERVED_LIVE_SLOTS']) if os.getenv('LLM_RESERVED_LIVE_SLOTS') else None
+)
+# Only configured API keys name a tenant - any other key is ignored, or a client
+# could send a fresh key per request to get a fresh quota and fair share
+TENANT_KEYS = parse_tenant_keys(os.getenv('LLM_TENANT_KEYS', ''))  # sha256(key) -> tenant
+# X-Tenant-ID is set by the client, so it is only honoured on requests that
+# carry one of these API keys (e.g. a gateway that tags each customer)
+TENANT_GATEWAY_KEY_HASHES = frozenset(
+    hashlib.sha256(key.strip().encode()).hexdigest()
+    for key in os.getenv('LLM_TENANT_GATEWAY_KEYS', '').split(',') if key.strip()
+)
+
 # ======================
 # HELPER FUNCTIONS
 # ======================
 
-def call_groq_api(prompt, temperature=0.3, max_tokens=2000):
+def lazy_import(module_name):
+    """Import a module on first use (subsequent calls hit the sys.modules cache)"""
+    return importlib.import_module(module_name)
+
+def preload_heavy_modules():
+    """Import heavy modules eagerly (used with gunicorn preload_app)"""
+    modules = list(HEAVY_MODULES)
+    if SIMILARITY_BACKEND == 'sklearn':
+        modules.append('sklearn.metrics.pairwise')
+    for module_name in modules:
+        lazy_import(module_name)
+
+def get_groq_client():
+    """
+    Return the Groq client, creating it on first use
+    
+    The client is tied to the process that created it, so a client built in a
+    gunicorn master (preload_app) is never reused by forked workers - each
+    worker builds its own connection pool on its first LLM call.
+    """
+    global groq_client, _groq_client_pid
+    
+    pid = os.getpid()
+    if groq_client is None or _groq_client_pid != pid:
+        with _groq_client_lock:
+            if groq_client is None or _groq_client_pid != pid:
+                groq_module = lazy_import('groq')
+                groq_client = groq_module.Groq(api_key=groq_api_key)
+                _groq_client_pid = pid
+    return groq_client
+
+def current_tenant():
+    """
+    Tenant an LLM call is charged to: the tenant of a configured X-API-Key
+    (LLM_TENANT_KEYS), else the client address ('default' outside a request).
+    Requests carrying a gateway key (LLM_TENANT_GATEWAY_KEYS) may name the
+    tenant with X-Tenant-ID.
+    """
+    if not has_request_context():
+        return 'default'
+    api_key = request.headers.get('X-API-Key', '').strip()
+    if api_key:
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+        tenant_id = request.headers.get('X-Tenant-ID', '').strip()
+        if tenant_id and key_hash in TENANT_GATEWAY_KEY_HASHES:
+            return tenant_id[:64]
+        if key_hash in TENANT_KEYS:
+            return TENANT_KEYS[key_hash]
+    return request.remote_addr or 'default'
+
+def request_traffic_class(default):
+    """Route's traffic class, lowered (never raised) by an X-Traffic-Class header"""
+    requested = request.headers.get('X-Traffic-Class', '').strip().upper() if has_request_context() else ''
+    if requested in TrafficClass.__members__:
+        return max(default, TrafficClass[requested])
+    return default
+
+def too_busy_response(error):
+    """429 with Retry-After for a shed LLM call"""
+    return jsonify({
+        'error': str(error),
+        'reason': error.reason,
+        'retry_after': error.retry_after
+    }), 429, {'Retry-After': str(error.retry_after)}
+
+def resume_tool(view):
+    """Run a non-live route only while it fits in NON_LIVE_REQUEST_THREADS, else answer 429"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not non_live_requests.acquire(blocking=False):
+            return too_busy_response(SchedulerRejected(
+                'All request threads for resume tools are busy',
+                llm_scheduler.estimated_wait(TrafficClass.INTERACTIVE), 'busy'))
+        try:
+            return view(*args, **kwargs)
+        finally:
+            non_live_requests.release()
+    return wrapper
+
+def call_groq_api(prompt, temperature=0.3, max_tokens=2000, traffic_class=TrafficClass.INTERACTIVE, tenant=None):
     """
     Call Groq API with the given prompt
     
@@ -56,29 +259,37 @@ def call_groq_api(prompt, temperature=0.3, max_tokens=2000):
         prompt: The prompt to send
         temperature: Controls randomness (0-2)
         max_tokens: Maximum tokens in response
+        traffic_class: Scheduling class (LIVE, INTERACTIVE or BATCH)
+        tenant: Tenant to charge (defaults to the current request's tenant)
     
     Returns:
         str: The model's response text
+    
+    Raises:
+        SchedulerRejected: when the call is shed - routes answer 429 + Retry-After
     """
     try:
-        chat_completion = groq_client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful AI assistant that provides accurate, concise responses in the requested format."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            model=GROQ_MODEL,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        with llm_scheduler.slot(traffic_class, tenant or current_tenant()):
+            chat_completion = get_groq_client().chat.completions.create(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are a helpful AI assistant that provides accurate, concise responses in the requested format."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                model=GROQ_MODEL,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
         
         return chat_completion.choices[0].message.content.strip()
         
+    except SchedulerRejected:
+        raise
     except Exception as e:
         print(f"Groq API error: {e}")
         raise e
@@ -90,6 +301,7 @@ def get_embedding_simple(text):
     """
     # This is a simplified version - you can use sentence-transformers locally
     # or integrate with Groq's future embedding endpoints
+    np = lazy_import('numpy')
     words = text.lower().split()
     vocab = list(set(words))
     vector = [words.count(word) for word in vocab[:100]]  # Limit to 100 features
@@ -103,6 +315,14 @@ def get_embedding_simple(text):
     
     return np.array(vector, dtype=float)
 
+def cosine_similarity_numpy(vec1, vec2):
+    """Cosine similarity of two 1-D vectors using NumPy only"""
+    np = lazy_import('numpy')
+    norm = np.linalg.norm(vec1) * np.linalg.norm(vec2)
+    if norm == 0:
+        return 0.0
+    return float(np.dot(vec1, vec2) / norm)
+
 def calculate_semantic_similarity(text1, text2):
     """Calculate cosine similarity between two texts"""
     try:
@@ -110,31 +330,33 @@ def calculate_semantic_similarity(text1, text2):
         emb2 = get_embedding_simple(text2)
         
         if len(emb1) > 0 and len(emb2) > 0:
-            similarity = cosine_similarity(
-                [emb1], [emb2]
-            )[0][0]
+            if SIMILARITY_BACKEND == 'sklearn':
+                pairwise = lazy_import('sklearn.metrics.pairwise')
+                similarity = pairwise.cosine_similarity([emb1], [emb2])[0][0]
+            else:
+                similarity = cosine_similarity_numpy(emb1, emb2)
             return float(similarity) * 100  # Convert to percentage
         return 0
     except Exception as e:
         print(f"Similarity calculation error: {e}")
         return 0
 
+if PRELOAD_HEAVY_MODULES:
+    preload_heavy_modules()
+
 # ======================
 # RESUME INTELLIGENCE MODULE
 # ======================
 
-@app.route('/resume/analyze', methods=['POST'])
-def analyze_resume():
-    """Analyze candidate information and extract structured profile"""
-    try:
-        data = request.json
-        resume_text = data.get('resume_text', '')
-        
-        if not resume_text:
-            return jsonify({'error': 'Candidate information is required'}), 400
-        
-        # AI Prompt for candidate analysis (accepts resume, PDF text, or "about me" text)
-        prompt = f"""Analyze the following candidate information and extract structured data in JSON format.
+def analyze_resume_text(resume_text, traffic_class=TrafficClass.INTERACTIVE, tenant=None):
+    """
+    Extract a structured candidate profile from resume text and store it
+    
+    Returns:
+        tuple: (candidate_id, candidate_profile)
+    """
+    # AI Prompt for candidate analysis (accepts resume, PDF text, or "about me" text)
+    prompt = f"""Analyze the following candidate information and extract structured data in JSON format.
 The input can be a resume, PDF content, or a personal description about the candidate.
 
 Candidate Information:
@@ -155,41 +377,164 @@ Rules:
 - primary_domain: Primary field/domain (e.g., "Web Development", "Data Science", "Backend Engineering", "DevOps", etc.)
 
 Return ONLY the JSON object, no explanation or markdown formatting."""
+    
+    response_text = call_groq_api(prompt, temperature=0.2, traffic_class=traffic_class, tenant=tenant)
+    
+    # Clean response (remove markdown code blocks if present)
+    if response_text.startswith('```json'):
+        response_text = response_text.replace('```json', '').replace('```', '').strip()
+    elif response_text.startswith('```'):
+        response_text = response_text.replace('```', '').strip()
+    
+    candidate_profile = json.loads(response_text)
+    
+    # Validate structure
+    required_keys = ['skills', 'experience_years', 'projects', 'primary_domain']
+    if not all(key in candidate_profile for key in required_keys):
+        raise ValueError("Invalid profile structure from AI")
+    
+    # Store profile (and index it for candidate search)
+    candidate_id = str(uuid.uuid4())
+    candidate_index.add(candidate_id, candidate_profile)
+    
+    return candidate_id, candidate_profile
+
+@app.route('/resume/analyze', methods=['POST'])
+@resume_tool
+def analyze_resume():
+    """Analyze candidate information and extract structured profile"""
+    try:
+        data = request.json
+        resume_text = data.get('resume_text', '')
         
-        response_text = call_groq_api(prompt, temperature=0.2)
-        
-        # Clean response (remove markdown code blocks if present)
-        if response_text.startswith('```json'):
-            response_text = response_text.replace('```json', '').replace('```', '').strip()
-        elif response_text.startswith('```'):
-            response_text = response_text.replace('```', '').strip()
-        
-        candidate_profile = json.loads(response_text)
-        
-        # Validate structure
-        required_keys = ['skills', 'experience_years', 'projects', 'primary_domain']
-        if not all(key in candidate_profile for key in required_keys):
-            raise ValueError("Invalid profile structure from AI")
+        if not resume_text:
+            return jsonify({'error': 'Candidate information is required'}), 400
         
-        # Store profile
-        candidate_id = str(uuid.uuid4())
-        candidate_profiles[candidate_id] = candidate_profile
+        candidate_id, candidate_profile = analyze_resume_text(
+            resume_text, traffic_class=request_traffic_class(TrafficClass.INTERACTIVE))
         
         return jsonify({
             'candidate_id': candidate_id,
             'candidate_profile': candidate_profile
         }), 200
         
+    except SchedulerRejected as e:
+        return too_busy_response(e)
     except json.JSONDecodeError as e:
         return jsonify({'error': f'Failed to parse AI response: {str(e)}'}), 500
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def analyze_extracted_resume(result, traffic_class=TrafficClass.INTERACTIVE, tenant=None):
+    """Run profile analysis for one ingestion result (used by the bulk thread pool)"""
+    if 'error' in result:
+        return result
+    try:
+        candidate_id, candidate_profile = analyze_resume_text(result['resume_text'], traffic_class, tenant)
+        return {**result, 'candidate_id': candidate_id, 'candidate_profile': candidate_profile}
+    except SchedulerRejected as e:
+        return {**result, 'error': str(e), 'retry_after': e.retry_after}
+    except json.JSONDecodeError as e:
+        return {**result, 'error': f'Failed to parse AI response: {str(e)}'}
+    except Exception as e:
+        return {**result, 'error': str(e)}
+
+@app.route('/resume/upload', methods=['POST'])
+@resume_tool
+def upload_resumes():
+    """
+    Ingest resume files (multipart) and analyze them
+    
+    Accepts one or more `file` parts: PDF, DOCX, TXT, or a ZIP of those for
+    bulk uploads. Files are streamed to disk, text is extracted in a process
+    pool (cached by file hash), and profiles are analyzed concurrently.
+    Send analyze=false to only extract text.
+    """
+    uploads = request.files.getlist('file')
+    if not uploads or not any(upload.filename for upload in uploads):
+        return jsonify({'error': 'At least one file is required (multipart field "file")'}), 400
+    
+    analyze = request.form.get('analyze', request.args.get('analyze', 'true')).lower() not in ('0', 'false', 'no')
+    work_dir = tempfile.mkdtemp(dir=UPLOAD_DIR)
+    
+    try:
+        stored_files, skipped = [], []
+        for upload in uploads:
+            if not upload.filename:
+                continue
+            extension = os.path.splitext(upload.filename)[1].lower()
+            if extension != '.zip' and extension not in SUPPORTED_EXTENSIONS:
+                skipped.append({'filename': upload.filename, 'error': f'Unsupported file type: {extension or "unknown"}'})
+                continue
+            
+            try:
+                stored = store_stream(upload.stream, upload.filename, work_dir,
+                                      max_bytes=MAX_UPLOAD_MB * 1024 * 1024 if extension == '.zip'
+                                      else MAX_RESUME_FILE_MB * 1024 * 1024)
+                if extension == '.zip':
+                    members, member_errors = expand_zip(
+                        stored.path, work_dir,
+                        max_files=MAX_BULK_FILES,
+                        max_file_bytes=MAX_RESUME_FILE_MB * 1024 * 1024
+                    )
+                    stored_files.extend(members)
+                    skipped.extend(member_errors)
+                else:
+                    stored_files.append(stored)
+            except zipfile.BadZipFile as e:
+                skipped.append({'filename': upload.filename, 'error': f'Invalid ZIP file: {str(e)}'})
+            except ValueError as e:
+                skipped.append({'filename': upload.filename, 'error': str(e)})
+        
+        results = ingestion_pipeline.extract(stored_files)
+        
+        if analyze:
+            # Multi-file uploads queue behind live and interactive LLM traffic
+            traffic_class = request_traffic_class(TrafficClass.BATCH if len(results) > 1 else TrafficClass.INTERACTIVE)
+            tenant = current_tenant()
+            with ThreadPoolExecutor(max_workers=max(1, min(BULK_ANALYZE_WORKERS, len(results)))) as executor:
+                results = list(executor.map(lambda result: analyze_extracted_resume(result, traffic_class, tenant),
+                                            results))
+        
+        return jsonify({
+            'results': results,
+            'skipped': skipped,
+            'processed': len(results),
+            'failed': sum(1 for r in results if 'error' in r) + len(skipped)
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
 # ======================
 # RESUME-JD MATCHING MODULE
 # ======================
 
+@app.route('/resume/skill-match', methods=['POST'])
+def skill_match():
+    """Instant skill overlap between resume and job description (no LLM call)"""
+    try:
+        data = request.json
+        resume_text = data.get('resume_text', '')
+        job_description = data.get('job_description', '')
+        candidate_id = data.get('candidate_id', '')
+        
+        if not resume_text or not job_description:
+            return jsonify({'error': 'resume_text and job_description are required'}), 400
+        
+        profile_skills = (candidate_index.get(candidate_id) or {}).get('skills', []) if candidate_id else []
+        overlap = skill_overlap(skill_matcher, resume_text, job_description, profile_skills)
+        if not overlap['jd_skills']:
+            overlap['note'] = 'No recognized skills in the job description; /resume/match-jd falls back to the AI'
+        return jsonify(overlap), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/resume/match-jd', methods=['POST'])
+@resume_tool
 def match_resume_to_jd():
     """Analyze resume compatibility with job description"""
     try:
@@ -201,10 +546,12 @@ def match_resume_to_jd():
         if not resume_text or not job_description:
             return jsonify({'error': 'resume_text and job_description are required'}), 400
         
+        traffic_class = request_traffic_class(TrafficClass.INTERACTIVE)
+        
         # Get candidate profile (analyze if not exists)
-        if candidate_id and candidate_id in candidate_profiles:
-            candidate_profile = candidate_profiles[candidate_id]
-        else:
+        candidate_profile = candidate_index.get(candidate_id) if candidate_id else None
+        stored_profile = candidate_profile is not None
+        if not stored_profile:
             # Analyze resume on the fly
             analyze_prompt = f"""Analyze the following candidate information and extract structured data in JSON format.
 
@@ -218,12 +565,32 @@ Extract and return ONLY a valid JSON object with this exact structure:
     "projects": ["project1", "project2", ...],
     "primary_domain": "domain name"
 }}"""
-            response_text = call_groq_api(analyze_prompt, temperature=0.2)
+            response_text = call_groq_api(analyze_prompt, temperature=0.2, traffic_class=traffic_class)
             if response_text.startswith('```'):
                 response_text = response_text.replace('```json', '').replace('```', '').strip()
             candidate_profile = json.loads(response_text)
         
-        # AI analysis prompt
+        # Skill overlap is a deterministic set operation - compute it locally.
+        # If the JD names no skills from the taxonomy, the LLM reports them instead.
+        # A profile built just now differs between runs, so only a stored one adds skills.
+        profile_skills = candidate_profile.get('skills', []) if stored_profile else []
+        overlap = skill_overlap(skill_matcher, resume_text, job_description, profile_skills)
+        local_skills = bool(overlap['jd_skills'])
+        if local_skills:
+            skill_section = f"""Skill Overlap (already computed):
+- Matched: {', '.join(overlap['matched_skills']) or 'None'}
+- Missing: {', '.join(overlap['missing_skills']) or 'None'}
+- Skill Match: {overlap['skill_match_percentage']}%
+"""
+            skill_fields = ""
+        else:
+            skill_section = ""
+            skill_fields = """
+    "skill_match_percentage": <0-100 number>,
+    "matched_skills": ["skill1", "skill2", ...],
+    "missing_skills": ["skill1", "skill2", ...],"""
+
+        # AI analysis prompt (narrative fields, plus skill fields when not computed above)
         matching_prompt = f"""Analyze the compatibility between a candidate's resume and a job description.
 
 RESUME:
@@ -237,14 +604,12 @@ Candidate Profile:
 - Experience: {candidate_profile.get('experience_years', 0)} years
 - Domain: {candidate_profile.get('primary_domain', 'Unknown')}
 
+{skill_section}
 Provide a detailed JSON analysis with:
 
 {{
     "ats_score": <0-100 number>,
-    "overall_match": <0-100 number>,
-    "skill_match_percentage": <0-100 number>,
-    "matched_skills": ["skill1", "skill2", ...],
-    "missing_skills": ["skill1", "skill2", ...],
+    "overall_match": <0-100 number>,{skill_fields}
     "matched_requirements": ["req1", "req2", ...],
     "unmet_requirements": ["req1", "req2", ...],
     "experience_match": "Suitable" | "Under-experienced" | "Over-qualified",
@@ -256,12 +621,11 @@ Provide a detailed JSON analysis with:
 
 ATS Score: How well the resume will pass ATS screening (0-100)
 Overall Match: How well candidate matches the job (0-100)
-Skill Match: Percentage of job-required skills the candidate has
 Experience Match: Whether experience level aligns with job level
 
 Return ONLY the JSON object."""
         
-        match_text = call_groq_api(matching_prompt, temperature=0.3, max_tokens=2000)
+        match_text = call_groq_api(matching_prompt, temperature=0.3, max_tokens=2000, traffic_class=traffic_class)
         
         if match_text.startswith('```'):
             match_text = match_text.replace('```json', '').replace('```', '').strip()
@@ -271,9 +635,11 @@ Return ONLY the JSON object."""
         return jsonify({
             'ats_score': match_data.get('ats_score', 0),
             'overall_match': match_data.get('overall_match', 0),
-            'skill_match_percentage': match_data.get('skill_match_percentage', 0),
-            'matched_skills': match_data.get('matched_skills', []),
-            'missing_skills': match_data.get('missing_skills', []),
+            'skill_match_percentage': (overlap['skill_match_percentage'] if local_skills
+                                       else match_data.get('skill_match_percentage', 0)),
+            'matched_skills': overlap['matched_skills'] if local_skills else match_data.get('matched_skills', []),
+            'missing_skills': overlap['missing_skills'] if local_skills else match_data.get('missing_skills', []),
+            'skill_match_source': 'taxonomy' if local_skills else 'ai',
             'matched_requirements': match_data.get('matched_requirements', []),
             'unmet_requirements': match_data.get('unmet_requirements', []),
             'experience_match': match_data.get('experience_match', 'Unknown'),
@@ -283,12 +649,15 @@ Return ONLY the JSON object."""
             'recommendations': match_data.get('recommendations', [])
         }), 200
         
+    except SchedulerRejected as e:
+        return too_busy_response(e)
     except json.JSONDecodeError as e:
         return jsonify({'error': f'Failed to parse matching response: {str(e)}'}), 500
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/resume/rewrite', methods=['POST'])
+@resume_tool
 def rewrite_resume():
     """Rewrite resume to better match job description using AI"""
     try:
@@ -327,7 +696,8 @@ INSTRUCTIONS:
 
 Return the rewritten resume ONLY - no explanations or commentary."""
         
-        rewritten_resume = call_groq_api(rewrite_prompt, temperature=0.5, max_tokens=3000)
+        rewritten_resume = call_groq_api(rewrite_prompt, temperature=0.5, max_tokens=3000,
+                                         traffic_class=request_traffic_class(TrafficClass.INTERACTIVE))
         
         # Clean response
         rewritten_resume = rewritten_resume.strip()
@@ -338,6 +708,66 @@ Return the rewritten resume ONLY - no explanations or commentary."""
             'message': 'Resume has been optimized for the job description'
         }), 200
         
+    except SchedulerRejected as e:
+        return too_busy_response(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# ======================
+# CANDIDATE SEARCH MODULE
+# ======================
+
+@app.route('/candidates/search', methods=['POST'])
+def search_candidates():
+    """Top-N stored candidates for a job description and/or skill list"""
+    try:
+        data = request.json or {}
+        job_description = data.get('job_description', '')
+        skills = data.get('skills', [])
+        
+        if not job_description and not skills and not data.get('domain'):
+            return jsonify({'error': 'job_description, skills or domain is required'}), 400
+        if not isinstance(skills, list):
+            return jsonify({'error': 'skills must be a list'}), 400
+        
+        try:
+            min_experience = float(data['min_experience']) if data.get('min_experience') is not None else None
+            max_experience = float(data['max_experience']) if data.get('max_experience') is not None else None
+            limit = max(1, min(MAX_SEARCH_RESULTS, int(data.get('limit', 10))))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'min_experience, max_experience and limit must be numbers'}), 400
+        
+        started = time.perf_counter()
+        candidate_index.refresh()
+        results, total_matches = candidate_index.search(
+            skills=skills,
+            job_description=job_description,
+            min_experience=min_experience,
+            max_experience=max_experience,
+            domain=data.get('domain', ''),
+            limit=limit
+        )
+        
+        return jsonify({
+            'results': results,
+            'total_matches': total_matches,
+            'indexed_candidates': len(candidate_index),
+            'took_ms': round((time.perf_counter() - started) * 1000, 2)
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/candidates/<candidate_id>', methods=['DELETE'])
+def delete_candidate(candidate_id):
+    """Remove a stored candidate profile from the index and its log"""
+    try:
+        # Another worker may have stored it since our last read
+        candidate_index.refresh()
+        if not candidate_index.remove(candidate_id):
+            return jsonify({'error': 'Candidate not found'}), 404
+        return jsonify({'deleted': candidate_id}), 200
+
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -356,38 +786,42 @@ def start_interview():
         if not candidate_id or not job_description:
             return jsonify({'error': 'candidate_id and job_description are required'}), 400
         
-        # Get candidate profile
-        candidate_profile = candidate_profiles.get(candidate_id)
+        # Get candidate profile (another worker may have analyzed it - pick up its log entries)
+        candidate_profile = candidate_index.get(candidate_id)
+        if not candidate_profile and candidate_index.refresh():
+            candidate_profile = candidate_index.get(candidate_id)
         if not candidate_profile:
             return jsonify({'error': 'Candidate profile not found. Please analyze resume first.'}), 404
         
         # Create session
         session_id = str(uuid.uuid4())
-        sessions[session_id] = {
-            'session_id': session_id,
-            'candidate_id': candidate_id,
-            'job_description': job_description,
-            'difficulty': 'EASY',
-            'question_count': 0,
-            'scores': [],
-            'fail_streak': 0,
-            'time_used': 0,
-            'status': 'ACTIVE',
-            'started_at': datetime.now().isoformat()
-        }
+        sessions[session_id] = InterviewSession(
+            session_id=session_id,
+            candidate_id=candidate_id,
+            job_description=job_description
+        )
         
         interview_responses[session_id] = []
+        question_indices[session_id] = session_question_index(candidate_profile, job_description)
         
-        # Generate first question
-        first_question = generate_question(session_id)
+        # Generate first question (drop the session again if the call is shed)
+        try:
+            first_question = generate_question(session_id)
+        except SchedulerRejected:
+            sessions.pop(session_id, None)
+            interview_responses.pop(session_id, None)
+            question_indices.pop(session_id, None)
+            raise
         
         return jsonify({
             'session_id': session_id,
             'first_question': first_question['question'],
-            'difficulty': 'EASY',
-            'time_limit': TIME_LIMITS['EASY']
+            'difficulty': Difficulty.EASY.name,
+            'time_limit': TIME_LIMITS[Difficulty.EASY]
         }), 200
         
+    except SchedulerRejected as e:
+        return too_busy_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -395,19 +829,29 @@ def start_interview():
 # QUESTION GENERATION ENGINE
 # ======================
 
+def session_question_index(candidate_profile, job_description):
+    """QuestionIndex that never lists the role's core skills as covered topics"""
+    core_skills = list(candidate_profile.get('skills', [])) + skill_matcher.extract(job_description)
+    return QuestionIndex(core_terms=core_skills)
+
 def generate_question(session_id):
     """Generate adaptive interview question"""
     session = sessions[session_id]
-    candidate_profile = candidate_profiles[session['candidate_id']]
+    candidate_profile = candidate_index.get(session.candidate_id)
     
-    difficulty = session['difficulty']
-    jd = session['job_description']
+    difficulty = session.difficulty.name
+    jd = session.job_description
+    domain = candidate_profile['primary_domain']
     
-    # Get past questions to avoid repetition
-    past_questions = [r['question'] for r in interview_responses.get(session_id, [])]
-    past_questions_text = "\n".join(f"- {q}" for q in past_questions) if past_questions else "None"
+    # Covered topics stand in for the full list of past questions
+    question_index = question_indices.get(session_id)
+    if question_index is None:
+        question_index = question_indices[session_id] = session_question_index(candidate_profile, jd)
+    covered_topics = question_index.topic_summary()
+    rejected_note = ""
     
-    prompt = f"""You are an expert technical interviewer. Generate ONE interview question.
+    for attempt in range(MAX_QUESTION_ATTEMPTS):
+        prompt = f"""You are an expert technical interviewer. Generate ONE interview question.
 
 Job Description:
 {jd}
@@ -419,31 +863,40 @@ Candidate Information:
 
 Difficulty Level: {difficulty}
 
-Past Questions Already Asked:
-{past_questions_text}
-
+Topics Already Covered:
+{covered_topics}
+{rejected_note}
 Requirements:
 - Question must be relevant to the job description
 - Difficulty must match {difficulty} level:
   * EASY: Basic concepts, definitions, simple scenarios (suitable for entry-level)
   * MEDIUM: Practical applications, problem-solving, trade-offs (suitable for mid-level)
   * HARD: System design, advanced concepts, complex scenarios (suitable for senior-level)
-- Do NOT repeat or rephrase past questions
+- Prefer topics not yet covered (the role's core skills can come up again from a new angle)
 - Question should be clear, specific, and focused on ONE topic
 - Keep question concise (1-3 sentences)
 
 Return ONLY the question text, no explanation, no preamble, no formatting."""
+        
+        question_text = call_groq_api(prompt, temperature=0.7, traffic_class=TrafficClass.LIVE)
+        
+        # Clean up any extra formatting
+        question_text = question_text.strip().strip('"\'')
+        
+        # Reject near-repeats locally instead of trusting the prompt
+        duplicate_reason, signatures = question_deduplicator.check(question_index, domain, question_text)
+        if not duplicate_reason:
+            break
+        print(f"Rejected duplicate question (attempt {attempt + 1}, {duplicate_reason}): {question_text}")
+        rejected_note = f'\nDo NOT ask this (already asked): "{question_text}"\n'
     
-    question_text = call_groq_api(prompt, temperature=0.7)
-    
-    # Clean up any extra formatting
-    question_text = question_text.strip().strip('"\'')
+    question_deduplicator.record(question_index, domain, question_text, signatures)
     
     return {
         'question': question_text,
         'difficulty': difficulty,
-        'time_limit': TIME_LIMITS[difficulty],
-        'skill_area': candidate_profile['primary_domain']
+        'time_limit': TIME_LIMITS[session.difficulty],
+        'skill_area': domain
     }
 
 @app.route('/interview/next-question', methods=['GET'])
@@ -457,11 +910,11 @@ def get_next_question():
         
         session = sessions[session_id]
         
-        if session['status'] != 'ACTIVE':
+        if session.status != Status.ACTIVE:
             return jsonify({'error': 'Interview session is not active'}), 400
         
         # Check if max questions reached
-        if session['question_count'] >= MAX_QUESTIONS:
+        if session.question_count >= MAX_QUESTIONS:
             return jsonify({'error': 'Maximum questions reached'}), 400
         
         question_data = generate_question(session_id)
@@ -472,6 +925,8 @@ def get_next_question():
             'time_limit': question_data['time_limit']
         }), 200
         
+    except SchedulerRejected as e:
+        return too_busy_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -493,62 +948,68 @@ def submit_answer():
             return jsonify({'error': 'Invalid session_id'}), 404
         
         session = sessions[session_id]
-        candidate_profile = candidate_profiles[session['candidate_id']]
+        candidate_profile = candidate_index.get(session.candidate_id)
+        if not candidate_profile:
+            return jsonify({'error': 'Candidate profile was deleted'}), 404
         
         # Evaluate answer
         evaluation = evaluate_answer(
             question, 
             answer_text, 
             time_taken, 
-            session['difficulty'],
-            session['job_description'],
+            session.difficulty,
+            session.job_description,
             candidate_profile
         )
         
         # Store response
-        response_data = {
-            'question': question,
-            'answer': answer_text,
-            'score': evaluation['score'],
-            'time_taken': time_taken,
-            'difficulty': session['difficulty'],
-            'feedback': evaluation['feedback']
-        }
-        interview_responses[session_id].append(response_data)
+        interview_responses[session_id].append(InterviewResponse(
+            question=question,
+            answer=answer_text,
+            score=evaluation['score'],
+            time_taken=time_taken,
+            difficulty=session.difficulty,
+            feedback=evaluation['feedback']
+        ))
         
         # Update session
-        session['scores'].append(evaluation['score'])
-        session['time_used'] += time_taken
-        session['question_count'] += 1
+        session.record_answer(evaluation['score'], time_taken)
         
         # Adaptation logic
-        next_difficulty, status, fail_streak = adapt_difficulty(session, evaluation['score'])
-        session['difficulty'] = next_difficulty
-        session['fail_streak'] = fail_streak
+        next_difficulty, status, fail_streak, decided = adapt_difficulty(session, evaluation['score'])
+        session.difficulty = next_difficulty
+        session.fail_streak = fail_streak
         
         # Check termination conditions
         if status == 'TERMINATED':
-            session['status'] = 'TERMINATED'
+            session.status = Status.TERMINATED
+            session.decision = 'FAIL'
+            reason = (f'Failed {FAIL_THRESHOLD} consecutive questions' if fail_streak >= FAIL_THRESHOLD
+                      else 'Performance confidently below the passing level')
             return jsonify({
                 'score': evaluation['score'],
                 'status': 'TERMINATED',
                 'feedback': evaluation['feedback'],
-                'reason': 'Failed 3 consecutive questions',
+                'reason': reason,
                 'message': 'Interview terminated due to poor performance'
             }), 200
         
-        # Check if max questions reached
-        if session['question_count'] >= MAX_QUESTIONS:
-            session['status'] = 'COMPLETED'
+        # Check if max questions reached (or the policy has reached a decision)
+        if decided or session.question_count >= MAX_QUESTIONS:
+            session.status = Status.COMPLETED
+        if decided:
+            session.decision = 'PASS'
         
         return jsonify({
             'score': evaluation['score'],
             'status': status,
             'feedback': evaluation['feedback'],
-            'next_difficulty': next_difficulty,
-            'questions_remaining': MAX_QUESTIONS - session['question_count']
+            'next_difficulty': next_difficulty.name,
+            'questions_remaining': 0 if decided else MAX_QUESTIONS - session.question_count
         }), 200
         
+    except SchedulerRejected as e:
+        return too_busy_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -559,7 +1020,7 @@ def evaluate_answer(question, answer, time_taken, difficulty, job_description, c
 
 Question: {question}
 Candidate's Answer: {answer}
-Difficulty Level: {difficulty}
+Difficulty Level: {difficulty.name}
 Job Requirements: {job_description}
 
 Evaluation Criteria:
@@ -584,7 +1045,7 @@ Guidelines for scoring:
 Return ONLY the JSON object, no other text."""
     
     try:
-        response_text = call_groq_api(prompt, temperature=0.3)
+        response_text = call_groq_api(prompt, temperature=0.3, traffic_class=TrafficClass.LIVE)
         
         # Clean response
         if response_text.startswith('```json'):
@@ -612,6 +1073,9 @@ Return ONLY the JSON object, no other text."""
         evaluation['score'] = round(final_score, 2)
         return evaluation
         
+    except SchedulerRejected:
+        # Shed calls are retried by the client, not scored with the fallback
+        raise
     except json.JSONDecodeError as e:
         print(f"JSON parse error: {e}, Response: {response_text}")
         # Fallback evaluation
@@ -632,37 +1096,13 @@ Return ONLY the JSON object, no other text."""
 # ======================
 
 def adapt_difficulty(session, latest_score):
-    """Adapt difficulty based on performance"""
-    current_difficulty = session['difficulty']
-    fail_streak = session['fail_streak']
-    
-    # Update fail streak
-    if latest_score < SCORE_THRESHOLD_DOWN:
-        fail_streak += 1
-    else:
-        fail_streak = 0
-    
-    # Check for termination
-    if fail_streak >= FAIL_THRESHOLD:
-        return current_difficulty, 'TERMINATED', fail_streak
-    
-    # Adapt difficulty
-    current_idx = DIFFICULTY_LEVELS.index(current_difficulty)
-    
-    if latest_score >= SCORE_THRESHOLD_UP and current_idx < len(DIFFICULTY_LEVELS) - 1:
-        # Increase difficulty
-        next_difficulty = DIFFICULTY_LEVELS[current_idx + 1]
-        status = 'CLEARED'
-    elif latest_score < SCORE_THRESHOLD_DOWN and current_idx > 0:
-        # Decrease difficulty
-        next_difficulty = DIFFICULTY_LEVELS[current_idx - 1]
-        status = 'WARNING'
-    else:
-        # Maintain difficulty
-        next_difficulty = current_difficulty
-        status = 'CLEARED' if latest_score >= SCORE_THRESHOLD_DOWN else 'WARNING'
+    """
+    Adapt difficulty based on performance
     
-    return next_difficulty, status, fail_streak
+    Returns:
+        tuple: (next_difficulty, status, fail_streak, decided) - see adaptation.Decision
+    """
+    return adaptation_policy.update(session, latest_score)
 
 # ======================
 # INTERVIEW TERMINATION ENGINE
@@ -685,8 +1125,7 @@ def end_interview():
             return jsonify({'error': 'No responses found for this session'}), 400
         
         # Calculate final score
-        scores = session['scores']
-        final_score = round(sum(scores) / len(scores), 2) if scores else 0
+        final_score = session.average_score
         
         # Determine category
         if final_score >= 75:
@@ -702,9 +1141,19 @@ def end_interview():
             category = 'WEAK'
             hiring_readiness = 'NO'
         
+        # An early verdict from the adaptation policy is the hiring decision.
+        # Adaptive interviews ask harder questions of stronger candidates, so
+        # their raw average can sit below the cutoffs above.
+        if session.decision == 'PASS':
+            hiring_readiness = 'YES'
+            if category in ('AVERAGE', 'WEAK'):
+                category = 'GOOD'
+        elif session.decision == 'FAIL':
+            hiring_readiness = 'NO'
+        
         # Generate strengths and weaknesses using AI
         qa_summary = "\n".join([
-            f"Q{i+1} (Score: {r['score']}): {r['question'][:100]}...\nA: {r['answer'][:150]}..."
+            f"Q{i+1} (Score: {r.score}): {r.question[:100]}...\nA: {r.answer[:150]}..."
             for i, r in enumerate(responses)
         ])
         
@@ -730,7 +1179,7 @@ Format:
 Be specific and constructive. Return ONLY the JSON object."""
         
         try:
-            feedback_text = call_groq_api(feedback_prompt, temperature=0.4)
+            feedback_text = call_groq_api(feedback_prompt, temperature=0.4, traffic_class=TrafficClass.LIVE)
             
             # Clean response
             if feedback_text.startswith('```json'):
@@ -742,14 +1191,16 @@ Be specific and constructive. Return ONLY the JSON object."""
             strengths = feedback_data.get('strengths', ['Completed the interview'])
             weaknesses = feedback_data.get('weaknesses', ['Continue practicing technical concepts'])
             
+        except SchedulerRejected:
+            raise
         except Exception as e:
             print(f"Feedback generation error: {e}")
             strengths = ['Completed the interview', 'Answered all questions', 'Demonstrated effort']
             weaknesses = ['Continue practicing', 'Review fundamental concepts', 'Improve response depth']
         
         # Update session status
-        session['status'] = 'COMPLETED'
-        session['ended_at'] = datetime.now().isoformat()
+        session.status = Status.COMPLETED
+        session.ended_at = time.time()
         
         return jsonify({
             'final_score': final_score,
@@ -757,15 +1208,18 @@ Be specific and constructive. Return ONLY the JSON object."""
             'strengths': strengths,
             'weaknesses': weaknesses,
             'hiring_readiness': hiring_readiness,
+            'early_decision': session.decision,
+            'ability': round(session.ability, 3) if session.ability is not None else None,
             'total_questions': len(responses),
-            'total_time': session['time_used'],
+            'total_time': session.time_used,
             'score_breakdown': {
-                'EASY': [r['score'] for r in responses if r['difficulty'] == 'EASY'],
-                'MEDIUM': [r['score'] for r in responses if r['difficulty'] == 'MEDIUM'],
-                'HARD': [r['score'] for r in responses if r['difficulty'] == 'HARD']
+                level.name: [r.score for r in responses if r.difficulty == level]
+                for level in Difficulty
             }
         }), 200
         
+    except SchedulerRejected as e:
+        return too_busy_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -779,9 +1233,16 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'model': GROQ_MODEL,
-        'active_sessions': len([s for s in sessions.values() if s['status'] == 'ACTIVE'])
+        'active_sessions': sum(1 for s in sessions.values() if s.status == Status.ACTIVE),
+        'llm_queue_depth': {name: stats['queue_depth']
+                            for name, stats in llm_scheduler.snapshot()['classes'].items()}
     }), 200
 
+@app.route('/metrics/llm', methods=['GET'])
+def llm_metrics():
+    """LLM scheduler metrics: queue depth, in-flight calls, wait times and shed counts per class"""
+    return jsonify(llm_scheduler.snapshot()), 200
+
 @app.route('/session/<session_id>', methods=['GET'])
 def get_session_status(session_id):
     """Get current session status"""
@@ -792,9 +1253,9 @@ def get_session_status(session_id):
     responses = interview_responses.get(session_id, [])
     
     return jsonify({
-        'session': session,
+        'session': session.to_dict(),
         'responses_count': len(responses),
-        'average_score': round(sum(session['scores']) / len(session['scores']), 2) if session['scores'] else 0
+        'average_score': session.average_score
     }), 200
 
 # ======================
@@ -820,8 +1281,13 @@ if __name__ == '__main__':
     print("📋 Endpoints available:")
     print("\n📄 RESUME ENDPOINTS:")
     print("   POST /resume/analyze - Analyze resume and extract profile")
+    print("   POST /resume/upload - Upload PDF/DOCX/TXT resumes or a ZIP of them")
+    print("   POST /resume/skill-match - Matched and missing skills from the skill taxonomy")
     print("   POST /resume/match-jd - Check resume-JD compatibility with ATS score")
     print("   POST /resume/rewrite - Rewrite resume to match JD better")
+    print("\n🔎 CANDIDATE ENDPOINTS:")
+    print("   POST /candidates/search - Rank stored candidates for a JD or skill list")
+    print("   DELETE /candidates/<id> - Delete a stored candidate profile")
     print("\n🎯 INTERVIEW ENDPOINTS:")
     print("   POST /interview/start - Start interview")
     print("   GET  /interview/next-question - Get next question")
@@ -830,5 +1296,6 @@ if __name__ == '__main__':
     print("\n🔧 UTILITY ENDPOINTS:")
     print("   GET  /health - Health check")
     print("   GET  /session/<id> - Session status")
+    print("   GET  /metrics/llm - LLM scheduler queue and wait-time metrics")
     port = int(os.getenv('PORT', 5000))
     app.run(debug=False, host='0.0.0.0', port=port)
\ No newline at end of file
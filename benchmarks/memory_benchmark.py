@@ -0,0 +1,140 @@
+"""
+Per-session memory benchmark
+
+Builds N finished interview sessions (10 answered questions each) twice - once
+as the old string-keyed dicts, once with the slotted models - and reports the
+memory allocated for each with tracemalloc.
+
+The text payload is realistic: ~1.5 KB job descriptions, ~150-character
+questions, ~600-character answers and ~250-character feedback, all distinct.
+By default every session has its own JD (no sharing at all); --jobs N draws
+the JDs from N open positions, as many candidates interview for the same job.
+
+Usage:
+    python benchmarks/memory_benchmark.py [--sessions 5000] [--questions 10] [--jobs 0]
+"""
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Difficulty, InterviewSession, InterviewResponse  # noqa: E402
+
+LEVELS = ['EASY', 'MEDIUM', 'HARD']
+WORDS = ('python flask postgresql api latency cache index query service deploy kubernetes docker queue '
+         'retry timeout scaling design tradeoff consistency replication partition monitoring test '
+         'team customer feature release incident review memory thread process request response').split()
+
+
+def make_text(rng, length):
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)
+
+
+def make_job_description(rng, jobs, index):
+    # Each request decodes its own copy of the JD, even for the same job
+    job = index if not jobs else rng.randrange(jobs)
+    return f'Job {job}: ' + make_text(random.Random(job), 1500)
+
+
+def build_dict_sessions(count, questions, jobs, rng):
+    sessions, responses = {}, {}
+    for index in range(count):
+        session_id = str(uuid.uuid4())
+        session = {
+            'session_id': session_id,
+            'candidate_id': str(uuid.uuid4()),
+            'job_description': make_job_description(rng, jobs, index),
+            'difficulty': 'EASY',
+            'question_count': 0,
+            'scores': [],
+            'fail_streak': 0,
+            'time_used': 0,
+            'status': 'ACTIVE',
+            'started_at': datetime.now().isoformat()
+        }
+        responses[session_id] = []
+        for _ in range(questions):
+            score = round(rng.uniform(0, 100), 2)
+            time_taken = rng.randint(20, 200)
+            responses[session_id].append({
+                'question': make_text(rng, 150),
+                'answer': make_text(rng, 600),
+                'score': score,
+                'time_taken': time_taken,
+                'difficulty': LEVELS[rng.randrange(3)],
+                'feedback': make_text(rng, 250)
+            })
+            session['scores'].append(score)
+            session['time_used'] += time_taken
+            session['question_count'] += 1
+        sessions[session_id] = session
+    return sessions, responses
+
+
+def build_model_sessions(count, questions, jobs, rng):
+    sessions, responses = {}, {}
+    for index in range(count):
+        session_id = str(uuid.uuid4())
+        session = InterviewSession(
+            session_id=session_id,
+            candidate_id=str(uuid.uuid4()),
+            job_description=make_job_description(rng, jobs, index)
+        )
+        responses[session_id] = []
+        for _ in range(questions):
+            score = round(rng.uniform(0, 100), 2)
+            time_taken = rng.randint(20, 200)
+            responses[session_id].append(InterviewResponse(
+                question=make_text(rng, 150),
+                answer=make_text(rng, 600),
+                score=score,
+                time_taken=time_taken,
+                difficulty=Difficulty(rng.randrange(3)),
+                feedback=make_text(rng, 250)
+            ))
+            session.record_answer(score, time_taken)
+        sessions[session_id] = session
+    return sessions, responses
+
+
+def measure(builder, count, questions, jobs):
+    rng = random.Random(42)
+    tracemalloc.start()
+    data = builder(count, questions, jobs, rng)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare per-session memory of dict vs slotted models')
+    parser.add_argument('--sessions', type=int, default=5000)
+    parser.add_argument('--questions', type=int, default=10)
+    parser.add_argument('--jobs', type=int, default=0,
+                        help='Distinct job descriptions shared by the sessions (0 = one per session)')
+    args = parser.parse_args()
+    
+    before = measure(build_dict_sessions, args.sessions, args.questions, args.jobs)
+    after = measure(build_model_sessions, args.sessions, args.questions, args.jobs)
+    
+    jobs = f'{args.jobs} distinct JDs' if args.jobs else 'a unique JD per session'
+    print(f"Memory benchmark ({args.sessions} sessions x {args.questions} answers, {jobs})")
+    print(f"  dict sessions:    {before / 1024 / 1024:8.2f} MiB  ({before / args.sessions:8.0f} B/session)")
+    print(f"  slotted sessions: {after / 1024 / 1024:8.2f} MiB  ({after / args.sessions:8.0f} B/session)")
+    print(f"  reduction:        {(1 - after / before) * 100:7.1f}%")
+
+
+if __name__ == '__main__':
+    main()
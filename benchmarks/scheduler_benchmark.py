@@ -0,0 +1,149 @@
+"""
+LLM scheduler benchmark
+
+Simulates recruiters running resume tools (interactive threads) and bulk
+uploads (batch threads) at the same time while candidates are in live
+interviews, against a fake LLM with fixed latency. Compares live-call wait
+times when every call shares one FIFO queue (the old behaviour: all calls
+equal), the traffic classes without reserved live slots, and the default
+LLMScheduler. Then shows how two tenants with unequal load share the
+interactive class with and without per-tenant fair queuing.
+
+Usage:
+    python benchmarks/scheduler_benchmark.py [--concurrency 8] [--latency-ms 40] [--bulk-threads 32]
+                                             [--interactive-threads 16]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler import ClassLimits, LLMScheduler, TrafficClass  # noqa: E402
+
+UNLIMITED = ClassLimits(max_share=1.0, max_queue=100000, max_wait=3600.0)
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))] * 1000 if values else 0.0
+
+
+def run(scheduler, live_class, interactive_class, batch_class, per_tenant, args):
+    """Interactive and bulk threads hammer the scheduler while live candidates make paced calls"""
+    stop = threading.Event()
+    live_waits, done = [], {'interactive': 0, 'batch': 0}
+    lock = threading.Lock()
+
+    def fake_call(traffic_class, tenant):
+        enqueued = time.perf_counter()
+        with scheduler.slot(traffic_class, tenant):
+            waited = time.perf_counter() - enqueued
+            time.sleep(args.latency_ms / 1000)
+        return waited
+
+    def load_worker(kind, traffic_class, tenant):
+        while not stop.is_set():
+            fake_call(traffic_class, tenant if per_tenant else 'shared')
+            with lock:
+                done[kind] += 1
+
+    def candidate(index):
+        for _ in range(args.live_calls):
+            waited = fake_call(live_class, f'candidate-{index}' if per_tenant else 'shared')
+            with lock:
+                live_waits.append(waited)
+            time.sleep(args.think_ms / 1000)
+
+    load = ([threading.Thread(target=load_worker, args=('batch', batch_class, 'bulk-recruiter'), daemon=True)
+             for _ in range(args.bulk_threads)]
+            + [threading.Thread(target=load_worker, args=('interactive', interactive_class, 'recruiter'),
+                                daemon=True)
+               for _ in range(args.interactive_threads)])
+    for thread in load:
+        thread.start()
+    time.sleep(0.2)  # let the interactive and batch backlog build up
+    started = time.perf_counter()
+    with lock:
+        warmup = dict(done)
+    candidates = [threading.Thread(target=candidate, args=(i,)) for i in range(args.candidates)]
+    for thread in candidates:
+        thread.start()
+    for thread in candidates:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    with lock:
+        served = {kind: done[kind] - warmup[kind] for kind in done}
+    stop.set()
+    for thread in load:
+        thread.join()
+    return live_waits, served, elapsed
+
+
+def fairness(args, per_tenant):
+    """Two tenants in the interactive class: one with 4x the threads of the other"""
+    scheduler = LLMScheduler(max_concurrency=args.concurrency, class_limits={TrafficClass.INTERACTIVE: UNLIMITED})
+    stop = threading.Event()
+    served = {'heavy': 0, 'light': 0}
+    lock = threading.Lock()
+
+    def worker(tenant):
+        while not stop.is_set():
+            with scheduler.slot(TrafficClass.INTERACTIVE, tenant if per_tenant else 'shared'):
+                time.sleep(args.latency_ms / 1000)
+            with lock:
+                served[tenant] += 1
+
+    threads = ([threading.Thread(target=worker, args=('heavy',)) for _ in range(args.concurrency * 4)]
+               + [threading.Thread(target=worker, args=('light',)) for _ in range(args.concurrency)])
+    for thread in threads:
+        thread.start()
+    time.sleep(2.0)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return served
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare FIFO LLM access with the fair-share scheduler')
+    parser.add_argument('--concurrency', type=int, default=8, help='LLM slots (LLM_MAX_CONCURRENCY)')
+    parser.add_argument('--latency-ms', type=float, default=40, help='Simulated LLM call latency')
+    parser.add_argument('--bulk-threads', type=int, default=32)
+    parser.add_argument('--interactive-threads', type=int, default=16)
+    parser.add_argument('--candidates', type=int, default=4)
+    parser.add_argument('--live-calls', type=int, default=10, help='Calls per candidate')
+    parser.add_argument('--think-ms', type=float, default=50, help='Pause between a candidate\'s calls')
+    args = parser.parse_args()
+
+    print(f"{args.interactive_threads} interactive + {args.bulk_threads} bulk threads vs "
+          f"{args.candidates} live candidates, {args.concurrency} slots, {args.latency_ms:.0f} ms per call\n")
+    print(f"{'mode':<12} {'live p50 ms':>12} {'live p95 ms':>12} {'live max ms':>12} "
+          f"{'interactive/s':>14} {'batch/s':>9}")
+
+    fifo = LLMScheduler(max_concurrency=args.concurrency, class_limits={TrafficClass.INTERACTIVE: UNLIMITED})
+    class_limits = {TrafficClass.INTERACTIVE: ClassLimits(0.75, 100000, 3600.0),
+                    TrafficClass.BATCH: ClassLimits(0.5, 100000, 3600.0, min_slots=1)}
+    no_reserve = LLMScheduler(max_concurrency=args.concurrency, class_limits=class_limits, reserved_live=0)
+    scheduled = LLMScheduler(max_concurrency=args.concurrency, class_limits=class_limits)
+    for name, scheduler, live_class, interactive_class, batch_class, per_tenant in [
+        ('fifo', fifo, TrafficClass.INTERACTIVE, TrafficClass.INTERACTIVE, TrafficClass.INTERACTIVE, False),
+        ('no reserve', no_reserve, TrafficClass.LIVE, TrafficClass.INTERACTIVE, TrafficClass.BATCH, True),
+        ('scheduled', scheduled, TrafficClass.LIVE, TrafficClass.INTERACTIVE, TrafficClass.BATCH, True),
+    ]:
+        live_waits, done, elapsed = run(scheduler, live_class, interactive_class, batch_class, per_tenant, args)
+        print(f"{name:<12} {percentile(live_waits, 0.5):>12.1f} {percentile(live_waits, 0.95):>12.1f} "
+              f"{percentile(live_waits, 1.0):>12.1f} {done['interactive'] / elapsed:>14.1f} "
+              f"{done['batch'] / elapsed:>9.1f}")
+
+    print(f"\nInteractive share, {args.concurrency * 4} heavy-tenant threads vs {args.concurrency} light-tenant threads:")
+    for name, per_tenant in [('fifo', False), ('fair queuing', True)]:
+        served = fairness(args, per_tenant)
+        total = sum(served.values()) or 1
+        print(f"  {name:<14} heavy {served['heavy'] / total:>4.0%}   light {served['light'] / total:>4.0%}")
+
+
+if __name__ == '__main__':
+    main()
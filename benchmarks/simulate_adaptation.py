@@ -0,0 +1,83 @@
+"""
+Adaptation policy simulator
+
+Replays many interviews under each registered adaptation policy and compares
+questions-to-decision (fewer questions = fewer LLM calls) and, for synthetic
+candidates, how often the pass/fail verdict matches the candidate's true
+ability.
+
+Caveat: synthetic candidates answer according to the same IRT model (item
+difficulties, discrimination, noise) that EloPolicy assumes, so the accuracy
+column only shows that the policy is consistent with its own model. It says
+nothing about real candidates. Use --archive to replay real score sequences.
+
+Usage:
+    python benchmarks/simulate_adaptation.py [--sessions 10000] [--seed 0]
+    python benchmarks/simulate_adaptation.py --archive sessions.json
+
+The archive is a JSON list of stored sessions (InterviewSession.to_record())
+or of plain score lists.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adaptation import POLICIES, get_policy, simulate, synthetic_responder, archived_responder  # noqa: E402
+
+
+def load_archive(path):
+    with open(path) as f:
+        records = json.load(f)
+    sequences = [record['sc'] if isinstance(record, dict) else record for record in records]
+    return [seq for seq in sequences if seq]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare adaptation policies on simulated interviews')
+    parser.add_argument('--sessions', type=int, default=10000, help='Synthetic candidates to simulate')
+    parser.add_argument('--max-questions', type=int, default=10)
+    parser.add_argument('--pass-score', type=float, default=60.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--archive', help='JSON file of archived sessions / score sequences to replay')
+    args = parser.parse_args()
+    
+    if args.archive:
+        sequences = load_archive(args.archive)
+        n_sessions = len(sequences)
+        truth = None
+        print(f"Replaying {n_sessions} archived score sequences")
+    else:
+        rng = np.random.default_rng(args.seed)
+        abilities = rng.normal(0.0, 1.0, size=args.sessions)
+        n_sessions = args.sessions
+        truth = abilities >= 0.0
+        print(f"Simulating {n_sessions} synthetic candidates (ability ~ N(0, 1), pass if ability >= 0)")
+    
+    print(f"  {'policy':<8} {'mean Q':>7} {'median Q':>9} {'early stop':>11} {'pass rate':>10} {'accuracy':>9} {'time (ms)':>10}")
+    for name in POLICIES:
+        if args.archive:
+            responder = archived_responder(sequences)
+        else:
+            responder = synthetic_responder(abilities, rng=np.random.default_rng(args.seed + 1))
+        
+        start = time.perf_counter()
+        result = simulate(get_policy(name), responder, n_sessions, args.max_questions, args.pass_score)
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        accuracy = f"{(result['passed'] == truth).mean() * 100:8.1f}%" if truth is not None else f"{'-':>9}"
+        print(f"  {name:<8} {result['mean_questions']:>7.2f} {result['median_questions']:>9.1f} "
+              f"{result['early_stop_rate'] * 100:>10.1f}% {result['pass_rate'] * 100:>9.1f}% "
+              f"{accuracy} {elapsed:>10.1f}")
+    if truth is not None:
+        print("  Note: synthetic answers follow the same IRT model EloPolicy assumes, so accuracy here is "
+              "self-consistency, not real-world validity (replay real sessions with --archive)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Skill matcher throughput benchmark
+
+Generates synthetic resumes/JDs from the taxonomy aliases mixed with filler
+text and measures how fast SkillMatcher extracts skills and computes the
+match-jd overlap. A naive baseline (one regex search per alias) is timed on a
+sample for comparison.
+
+Usage:
+    python benchmarks/skill_match_benchmark.py [--resumes 5000] [--words 600]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skills import SKILL_TAXONOMY, SkillMatcher, skill_overlap  # noqa: E402
+
+FILLER = ('led team delivered project improved performance built designed implemented scalable '
+          'services customers reduced latency owned roadmap collaborated stakeholders the a and of '
+          'with for on in to shipped features production reliable mentored engineers').split()
+
+
+def make_documents(count, words, rng):
+    aliases = [alias for name, values in SKILL_TAXONOMY.items() for alias in [name] + values]
+    documents = []
+    for _ in range(count):
+        tokens = [rng.choice(FILLER) for _ in range(words)]
+        for _ in range(rng.randint(5, 25)):
+            tokens[rng.randrange(words)] = rng.choice(aliases)
+        documents.append(' '.join(tokens))
+    return documents
+
+
+def naive_extract(patterns, text):
+    return [name for name, pattern in patterns if pattern.search(text)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure skill extraction throughput')
+    parser.add_argument('--resumes', type=int, default=5000)
+    parser.add_argument('--words', type=int, default=600, help='Words per synthetic resume')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    resumes = make_documents(args.resumes, args.words, rng)
+    job_description = make_documents(1, 300, rng)[0]
+    total_mb = sum(len(r) for r in resumes) / 1024 / 1024
+    
+    start = time.perf_counter()
+    matcher = SkillMatcher()
+    build_ms = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    for resume in resumes:
+        matcher.extract(resume)
+    extract_s = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for resume in resumes:
+        skill_overlap(matcher, resume, job_description)
+    overlap_s = time.perf_counter() - start
+    
+    patterns = [(name, re.compile(r'(?<![\w.])' + re.escape(alias) + r'(?![\w+#])', re.IGNORECASE))
+                for name, values in SKILL_TAXONOMY.items() for alias in [name] + values]
+    sample = resumes[:min(len(resumes), 500)]
+    start = time.perf_counter()
+    for resume in sample:
+        naive_extract(patterns, resume)
+    naive_per_doc = (time.perf_counter() - start) / len(sample)
+    
+    print(f"Skill matcher benchmark ({args.resumes} resumes, {total_mb:.1f} MB, {len(patterns)} aliases)")
+    print(f"  trie build:             {build_ms:8.1f} ms")
+    print(f"  extract:                {extract_s / args.resumes * 1e6:8.1f} us/resume  "
+          f"({args.resumes / extract_s:,.0f} resumes/s, {total_mb / extract_s:.1f} MB/s)")
+    print(f"  match-jd overlap:       {overlap_s / args.resumes * 1e6:8.1f} us/resume (resume + JD pass)")
+    print(f"  naive regex per alias:  {naive_per_doc * 1e6:8.1f} us/resume  "
+          f"({naive_per_doc / (extract_s / args.resumes):.1f}x slower)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Startup-time benchmark
+
+Imports app.py in a fresh interpreter with `python -X importtime` and reports
+the cumulative import time of each module app.py pulls in directly, plus the
+total wall time.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--top 15] [--preload]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_import(preload):
+    """Import app once in a subprocess and return (wall_seconds, {module: cumulative_us})"""
+    env = dict(os.environ)
+    env.setdefault('GROQ_API_KEY', 'benchmark-dummy-key')
+    env['PRELOAD_HEAVY_MODULES'] = '1' if preload else '0'
+    
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - start
+    
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing app failed:\n{result.stderr[-2000:]}")
+    
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    # Nesting is shown by two extra spaces of indentation per level, and a
+    # module is listed after everything it imported.
+    modules = {}
+    pending = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        if depth == 1:
+            pending[name] = int(parts[1])
+        elif depth == 0:
+            if name == 'app':
+                modules.update(pending)
+                modules['app (total)'] = int(parts[1])
+            pending = {}
+    return wall, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure app.py import time per module')
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreter runs')
+    parser.add_argument('--top', type=int, default=15, help='Number of modules to show')
+    parser.add_argument('--preload', action='store_true', help='Set PRELOAD_HEAVY_MODULES=1')
+    args = parser.parse_args()
+    
+    walls = []
+    per_module = {}
+    for _ in range(args.runs):
+        wall, modules = run_import(args.preload)
+        walls.append(wall)
+        for name, cumulative in modules.items():
+            per_module.setdefault(name, []).append(cumulative)
+    
+    medians = {name: statistics.median(values) for name, values in per_module.items()}
+    ranked = sorted(medians.items(), key=lambda item: item[1], reverse=True)
+    
+    mode = 'preload' if args.preload else 'lazy'
+    print(f"Startup benchmark ({mode} mode, {args.runs} runs)")
+    print(f"  Interpreter + import wall time (median): {statistics.median(walls) * 1000:.1f} ms")
+    print(f"  {'module':<40} {'cumulative (ms)':>16}")
+    for name, cumulative in ranked[:args.top]:
+        print(f"  {name:<40} {cumulative / 1000:>16.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+"""
+Near-duplicate detection for generated interview questions
+
+Questions are reduced to a set of stemmed content words and hashed into a
+MinHash signature. A candidate question is rejected when it is too similar to
+
+- a question already asked in the same session (QuestionIndex), or
+- a question already asked too many times across all sessions of the same
+  domain (DomainIndex, MinHash LSH buckets so lookups stay O(bands)).
+
+Each session also keeps a short list of covered topics, which replaces the
+ever-growing list of past questions in the generation prompt. The role's core
+skills (from the JD and profile) are never listed as covered, so the prompt
+does not steer the model away from the skills the interview is about. They are
+also left out of the session signatures: most questions in a Flask interview
+mention Flask, and sharing it does not make two questions the same.
+"""
+from collections import OrderedDict
+import hashlib
+import itertools
+import random
+import re
+import threading
+
+STOPWORDS = frozenset("""
+a about above after again all also an and any are as at be because been being between both but by
+can could did do does doing during each explain describe for from give had has have having how i if
+in into is it its itself me more most my no nor not of on once only or other our out over own same
+should so some such than that the their them then there these they this those through to too under
+until up very was we were what when where which while who whom why will with would you your
+example examples difference differences between using use used work works working walk us tell
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def content_words(text):
+    """Lowercased non-stopword tokens, in order"""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS and len(token) > 1]
+
+
+def stem(word):
+    """Very light suffix stripping so 'caching'/'cache', 'indexes'/'index' collide"""
+    if len(word) <= 4:
+        return word
+    # Plurals first
+    if word.endswith('ies'):
+        word = word[:-3] + 'y'
+    elif word.endswith(('sses', 'xes', 'ches', 'shes')):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+    for suffix in ('ing', 'ed', 'e'):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+
+def shingles(text):
+    return {stem(word) for word in content_words(text)}
+
+
+class MinHasher:
+    """MinHash signatures over shingle sets (universal hashing mod a Mersenne prime)"""
+
+    def __init__(self, num_perm=64, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.permutations = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                             for _ in range(num_perm)]
+
+    def signature(self, text, exclude=frozenset()):
+        """Signature of the text's shingles, minus `exclude` unless nothing else is left"""
+        words = shingles(text)
+        if exclude and not words <= exclude:
+            words -= exclude
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), 'little')
+                  for s in words]
+        if not hashes:
+            return tuple([_MERSENNE_PRIME] * self.num_perm)
+        return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self.permutations)
+
+
+def similarity(sig1, sig2):
+    """Estimated Jaccard similarity of two MinHash signatures"""
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class QuestionIndex:
+    """Questions asked in one session: signatures plus covered topics"""
+
+    __slots__ = ('signatures', 'topics', '_topic_stems', '_core_stems')
+
+    def __init__(self, core_terms=()):
+        """
+        Args:
+            core_terms: Skill names the whole interview is about (never reported as covered)
+        """
+        self.signatures = []
+        self.topics = []
+        self._topic_stems = set()
+        self._core_stems = {stem(word) for term in core_terms for word in content_words(term)}
+
+    def max_similarity(self, signature):
+        return max((similarity(signature, existing) for existing in self.signatures), default=0.0)
+
+    def add(self, question, signature, topics_per_question=3):
+        self.signatures.append(signature)
+        # Longest content words are usually the technical terms
+        words = [word for word in dict.fromkeys(content_words(question)) if stem(word) not in self._core_stems]
+        for word in sorted(words, key=len, reverse=True)[:topics_per_question]:
+            word_stem = stem(word)
+            if word_stem not in self._topic_stems:
+                self._topic_stems.add(word_stem)
+                self.topics.append(word)
+
+    def topic_summary(self, limit=24):
+        """Comma-separated covered topics (most recent last), or 'None'"""
+        return ', '.join(self.topics[-limit:]) if self.topics else 'None'
+
+
+class DomainIndex:
+    """
+    Questions asked across all sessions, per domain, with MinHash LSH buckets
+
+    Each entry counts how often a near-identical question was asked. Oldest
+    entries are evicted once a domain holds max_entries questions.
+    """
+
+    def __init__(self, num_perm=64, bands=16, max_entries=5000):
+        if num_perm % bands:
+            raise ValueError('num_perm must be divisible by bands')
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+        self._domains = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def _band_keys(self, signature):
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def _candidates(self, domain_data, keys):
+        entries, buckets = domain_data
+        seen = set()
+        for key in keys:
+            for entry_id in buckets.get(key, ()):
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    yield entry_id, entries[entry_id]
+
+    def _best_match(self, domain, signature, threshold):
+        domain_data = self._domains.get(domain)
+        if domain_data is None:
+            return None
+        best = None
+        for entry_id, entry in self._candidates(domain_data, self._band_keys(signature)):
+            score = similarity(signature, entry[0])
+            if score >= threshold and (best is None or score > best[1]):
+                best = (entry_id, score)
+        return best
+
+    def repeat_count(self, domain, signature, threshold):
+        """How many times a near-duplicate of this question was asked in the domain"""
+        with self._lock:
+            match = self._best_match(domain, signature, threshold)
+            return self._domains[domain][0][match[0]][1] if match else 0
+
+    def add(self, domain, signature, threshold):
+        with self._lock:
+            match = self._best_match(domain, signature, threshold)
+            if match:
+                self._domains[domain][0][match[0]][1] += 1
+                return
+
+            entries, buckets = self._domains.setdefault(domain, (OrderedDict(), {}))
+            entry_id = next(self._ids)
+            keys = self._band_keys(signature)
+            entries[entry_id] = [signature, 1, keys]
+            for key in keys:
+                buckets.setdefault(key, []).append(entry_id)
+
+            if len(entries) > self.max_entries:
+                old_id, (_, _, old_keys) = entries.popitem(last=False)
+                for key in old_keys:
+                    bucket = buckets.get(key)
+                    if bucket:
+                        bucket.remove(old_id)
+                        if not bucket:
+                            del buckets[key]
+
+
+class QuestionDeduplicator:
+    """Session + domain near-duplicate check for generated questions"""
+
+    def __init__(self, session_threshold=0.5, domain_threshold=0.85, domain_repeat_limit=3,
+                 num_perm=64, bands=16, max_domain_entries=5000):
+        self.session_threshold = session_threshold
+        self.domain_threshold = domain_threshold
+        self.domain_repeat_limit = domain_repeat_limit
+        self.hasher = MinHasher(num_perm=num_perm)
+        self.domain_index = DomainIndex(num_perm=num_perm, bands=bands, max_entries=max_domain_entries)
+
+    def check(self, question_index, domain, question):
+        """
+        Check a generated question against the session and domain indexes
+
+        Returns:
+            tuple: (reason or None, signatures) - reason is set when the question is a near-duplicate;
+            pass signatures on to record()
+        """
+        # The session compares questions without the role's core skills; the
+        # domain index spans sessions with different core skills, so it keeps them
+        domain_signature = self.hasher.signature(question)
+        session_signature = (self.hasher.signature(question, exclude=question_index._core_stems)
+                             if question_index._core_stems else domain_signature)
+        signatures = (session_signature, domain_signature)
+        if question_index.max_similarity(session_signature) >= self.session_threshold:
+            return 'already asked in this session', signatures
+        if self.domain_index.repeat_count(domain, domain_signature, self.domain_threshold) >= self.domain_repeat_limit:
+            return f'asked {self.domain_repeat_limit}+ times in {domain}', signatures
+        return None, signatures
+
+    def record(self, question_index, domain, question, signatures):
+        session_signature, domain_signature = signatures
+        question_index.add(question, session_signature)
+        self.domain_index.add(domain, domain_signature, self.domain_threshold)
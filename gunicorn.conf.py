@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration (loaded automatically by `gunicorn app:app`)
+
+Set GUNICORN_PRELOAD=1 to import the app once in the master process and fork
+workers from it. Combine with PRELOAD_HEAVY_MODULES=1 so numpy/groq are
+imported before the fork and shared copy-on-write between workers.
+
+Workers use threads (gthread) so one process serves several requests at a
+time and its LLM scheduler can order live, interactive and batch calls
+against each other. The scheduler is per process: the service as a whole
+makes up to WEB_CONCURRENCY x LLM_MAX_CONCURRENCY concurrent LLM calls.
+GUNICORN_THREADS should stay above LLM_MAX_CONCURRENCY so requests can
+queue in the scheduler rather than in gunicorn's backlog. app.py reads the
+same variable and keeps a quarter of the threads free of resume tools, so
+interview requests never wait behind them for a thread.
+"""
+import os
+
+workers = int(os.getenv('WEB_CONCURRENCY', 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 16))
+preload_app = os.getenv('GUNICORN_PRELOAD', 'false').lower() in ('1', 'true', 'yes')
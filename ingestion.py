@@ -0,0 +1,439 @@
+"""
+Resume ingestion pipeline
+
+Turns uploaded files (PDF, DOCX, TXT, or a ZIP of them) into clean resume text:
+
+1. store_stream(): stream the upload to disk in chunks, hashing as it goes
+2. expand_zip(): stream each member of a bulk ZIP to disk the same way
+3. IngestionPipeline.extract(): look the SHA-256 up in the text cache, extract
+   the misses in a process pool (PDF parsing is CPU-bound), normalize and
+   strip boilerplate, and cache the result on disk by hash
+
+DOCX is read straight from its XML with the standard library; PDF needs pypdf.
+
+The cache holds personal data, so entries expire after max_age seconds and the
+directory is trimmed to max_bytes (least recently used first).
+
+Pool workers re-import the launching script as __mp_main__ when they start
+(spawn and forkserver alike): under gunicorn that is gunicorn's own entry
+point, under `python app.py` it is app.py minus its __main__ block. Importing
+app does no I/O beyond creating the upload directory, so that stays cheap.
+
+A file whose extraction takes longer than extract_timeout is reported as
+failed, and the pool it hangs in is replaced.
+"""
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import multiprocessing
+import os
+import re
+import threading
+import time
+import zipfile
+from xml.etree import ElementTree
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt')
+CHUNK_SIZE = 64 * 1024
+
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Lines that carry no information about the candidate
+_BOILERPLATE_PATTERNS = [
+    re.compile(r'^page\s*\d+(\s*(of|/)\s*\d+)?$', re.IGNORECASE),
+    re.compile(r'^-?\s*\d{1,3}\s*-?$'),
+    re.compile(r'^(curriculum vitae|resume|résumé|cv)$', re.IGNORECASE),
+    re.compile(r'^references?( are)? available (up)?on request\.?$', re.IGNORECASE),
+    re.compile(r'^(confidential|private (and|&) confidential)$', re.IGNORECASE),
+]
+_BULLET_RE = re.compile(r'^[•●▪◦‣⁃∙*·▪➢✓►-]+\s*')
+_HYPHEN_BREAK_RE = re.compile(r'(\w)-\n(\w)')
+_SPACES_RE = re.compile(r'[ \t ​]+')
+
+
+@dataclass(slots=True)
+class StoredFile:
+    filename: str
+    path: str
+    sha256: str
+    size: int
+
+    @property
+    def extension(self):
+        return os.path.splitext(self.filename)[1].lower()
+
+
+def _safe_name(filename):
+    """Basename without path components or odd characters"""
+    name = os.path.basename(filename.replace('\\', '/')) or 'upload'
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', name)
+
+
+def store_stream(stream, filename, directory, max_bytes=None):
+    """
+    Stream an upload to disk in CHUNK_SIZE pieces, hashing while writing
+
+    Args:
+        stream: Readable binary stream (werkzeug FileStorage.stream, zip member)
+        filename: Original filename (only its basename is used)
+        directory: Directory to write into
+        max_bytes: Optional size limit; ValueError if exceeded
+
+    Returns:
+        StoredFile
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = _open_unique(directory, _safe_name(filename))
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise ValueError(f'{filename} exceeds the {max_bytes // (1024 * 1024)} MB limit')
+                digest.update(chunk)
+                out.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return StoredFile(filename=filename, path=path, sha256=digest.hexdigest(), size=size)
+
+
+def _open_unique(directory, name):
+    base, ext = os.path.splitext(name)
+    for counter in range(10000):
+        candidate = os.path.join(directory, f'{base}_{counter}{ext}' if counter else name)
+        try:
+            return os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), candidate
+        except FileExistsError:
+            continue
+    raise ValueError(f'Could not store {name}')
+
+
+def expand_zip(path, directory, max_files=200, max_file_bytes=10 * 1024 * 1024, max_total_bytes=200 * 1024 * 1024):
+    """
+    Stream every supported member of a ZIP archive to disk
+
+    Limits guard against zip bombs: member count, per-file and total
+    uncompressed size are checked while streaming, not trusted from headers.
+
+    Returns:
+        tuple: (stored files, skipped [{'filename', 'error'}])
+    """
+    stored, skipped = [], []
+    total = 0
+    with zipfile.ZipFile(path) as archive:
+        members = [m for m in archive.infolist()
+                   if not m.is_dir() and not m.filename.startswith('__MACOSX/')
+                   and not os.path.basename(m.filename).startswith('.')]
+        if len(members) > max_files:
+            raise ValueError(f'ZIP contains {len(members)} files; the limit is {max_files}')
+        for member in members:
+            if os.path.splitext(member.filename)[1].lower() not in SUPPORTED_EXTENSIONS:
+                skipped.append({'filename': member.filename, 'error': 'Unsupported file type'})
+                continue
+            limit = min(max_file_bytes, max_total_bytes - total)
+            try:
+                with archive.open(member) as stream:
+                    stored_file = store_stream(stream, member.filename, directory, max_bytes=limit)
+            except ValueError as e:
+                skipped.append({'filename': member.filename, 'error': str(e)})
+                continue
+            total += stored_file.size
+            stored.append(stored_file)
+    return stored, skipped
+
+
+# ======================
+# TEXT EXTRACTION (runs in worker processes)
+# ======================
+
+def extract_pdf_pages(path):
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    return [page.extract_text() or '' for page in reader.pages]
+
+
+def extract_docx_pages(path):
+    """Paragraph text from word/document.xml (no python-docx needed)"""
+    with zipfile.ZipFile(path) as archive:
+        with archive.open('word/document.xml') as document:
+            paragraphs = []
+            for _, element in ElementTree.iterparse(document):
+                if element.tag == f'{_WORD_NS}p':
+                    parts = []
+                    for node in element.iter():
+                        if node.tag == f'{_WORD_NS}t':
+                            parts.append(node.text or '')
+                        elif node.tag == f'{_WORD_NS}tab':
+                            parts.append('\t')
+                        elif node.tag == f'{_WORD_NS}br':
+                            parts.append('\n')
+                    paragraphs.append(''.join(parts))
+                    element.clear()
+    return ['\n'.join(paragraphs)]
+
+
+def extract_txt_pages(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    for encoding in ('utf-8-sig', 'cp1252'):
+        try:
+            return [raw.decode(encoding)]
+        except UnicodeDecodeError:
+            continue
+    return [raw.decode('latin-1')]
+
+
+_EXTRACTORS = {
+    '.pdf': extract_pdf_pages,
+    '.docx': extract_docx_pages,
+    '.txt': extract_txt_pages,
+}
+
+
+def normalize_text(pages):
+    """
+    Join extracted pages into clean text
+
+    - keeps only the first copy of lines repeated on most pages (running headers/footers)
+    - drops page numbers and other boilerplate lines
+    - rejoins words hyphenated across line breaks
+    - normalizes bullets and whitespace, collapses blank runs
+    """
+    page_lines = [[_SPACES_RE.sub(' ', line).strip() for line in _HYPHEN_BREAK_RE.sub(r'\1\2', page).splitlines()]
+                  for page in pages]
+
+    repeated = set()
+    if len(page_lines) >= 3:
+        counts = Counter(line for lines in page_lines for line in set(lines) if line)
+        repeated = {line for line, count in counts.items() if count >= len(page_lines) * 0.6}
+
+    output = []
+    seen_repeated = set()
+    for lines in page_lines:
+        for line in lines:
+            if line in repeated:
+                if line in seen_repeated:
+                    continue
+                seen_repeated.add(line)
+            if any(pattern.match(line) for pattern in _BOILERPLATE_PATTERNS):
+                continue
+            line = _BULLET_RE.sub('- ', line) if line else line
+            if line or (output and output[-1]):
+                output.append(line)
+    return '\n'.join(output).strip()
+
+
+def extract_text(path, extension):
+    """Extract and normalize text from one stored file (process-pool entry point)"""
+    extractor = _EXTRACTORS.get(extension)
+    if extractor is None:
+        raise ValueError(f'Unsupported file type: {extension or "unknown"}')
+    return normalize_text(extractor(path))
+
+
+# ======================
+# CACHE + PIPELINE
+# ======================
+
+class TextCache:
+    """Extracted text on disk, keyed by the SHA-256 of the original file"""
+
+    PRUNE_EVERY = 100  # puts between directory scans
+
+    def __init__(self, directory, max_bytes=200 * 1024 * 1024, max_age=7 * 24 * 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._puts = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.prune()
+
+    def _path(self, sha256):
+        return os.path.join(self.directory, f'{sha256}.txt')
+
+    def get(self, sha256):
+        path = self._path(sha256)
+        try:
+            if self.max_age and time.time() - os.path.getmtime(path) > self.max_age:
+                os.remove(path)
+                return None
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+            os.utime(path)  # mtime doubles as last-used time for pruning
+            return text
+        except FileNotFoundError:
+            return None
+
+    def put(self, sha256, text):
+        # Write-then-rename so concurrent workers never read a partial file
+        tmp_path = f'{self._path(sha256)}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, self._path(sha256))
+        with self._lock:
+            self._puts += 1
+            due = self._puts % self.PRUNE_EVERY == 0
+        if due:
+            self.prune()
+
+    def prune(self):
+        """Delete expired entries, then the least recently used until under max_bytes"""
+        now = time.time()
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith('.txt'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if self.max_age and now - stat.st_mtime > self.max_age:
+                    self._remove(entry.path)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        if self.max_bytes and total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                self._remove(path)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _pool_context():
+    """
+    forkserver where available: workers are forked from a small server process
+    that has already imported this module and pypdf - never from a threaded web
+    worker. Falls back to spawn elsewhere.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__, 'pypdf'])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _terminate(processes):
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
+class IngestionPipeline:
+    """Cache lookup + process-pool extraction for stored uploads"""
+
+    def __init__(self, cache_dir, max_workers=None, max_chars=None, cache_max_bytes=200 * 1024 * 1024,
+                 cache_max_age=7 * 24 * 3600, extract_timeout=60):
+        self.cache = TextCache(cache_dir, max_bytes=cache_max_bytes, max_age=cache_max_age)
+        self.max_workers = max_workers
+        self.max_chars = max_chars
+        self.extract_timeout = extract_timeout
+        self._pool = None
+        self._pool_pid = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        # One pool per process; a pool inherited across fork is unusable
+        pid = os.getpid()
+        if self._pool is None or self._pool_pid != pid:
+            with self._lock:
+                if self._pool is None or self._pool_pid != pid:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=_pool_context()
+                    )
+                    self._pool_pid = pid
+        return self._pool
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None and self._pool_pid == os.getpid():
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._pool_pid = None
+
+    def _retire_pool(self, pool):
+        """
+        Replace a pool with a hung worker. Tasks already queued on it (other
+        requests' files) get one more extract_timeout to finish before its
+        processes are terminated.
+        """
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+                self._pool_pid = None
+        processes = list((getattr(pool, '_processes', None) or {}).values())
+        pool.shutdown(wait=False)
+        timer = threading.Timer(self.extract_timeout, _terminate, args=(processes,))
+        timer.daemon = True
+        timer.start()
+
+    def extract(self, stored_files):
+        """
+        Extract text for every stored file (cache first, then the process pool)
+
+        Returns:
+            list of dicts, one per file, in order:
+            {'filename', 'file_hash', 'cached', 'resume_text'} or {'filename', 'file_hash', 'error'}
+        """
+        results = [None] * len(stored_files)
+        pending = {}  # sha256 -> (pool, future, [result indexes])
+
+        for i, stored in enumerate(stored_files):
+            if stored.sha256 in pending:
+                pending[stored.sha256][2].append(i)
+                continue
+            text = self.cache.get(stored.sha256)
+            if text is not None:
+                results[i] = self._result(stored, text, cached=True)
+                continue
+            if stored.extension not in SUPPORTED_EXTENSIONS:
+                results[i] = {'filename': stored.filename, 'file_hash': stored.sha256,
+                              'error': f'Unsupported file type: {stored.extension or "unknown"}'}
+                continue
+            pool = self._get_pool()
+            future = pool.submit(extract_text, stored.path, stored.extension)
+            pending[stored.sha256] = (pool, future, [i])
+
+        for sha256, (pool, future, indexes) in pending.items():
+            try:
+                try:
+                    text = future.result(timeout=self.extract_timeout)
+                except TimeoutError:
+                    if not future.cancel():  # still running, not just queued
+                        self._retire_pool(pool)
+                    raise TimeoutError(f'Text extraction timed out after {self.extract_timeout:g}s')
+                if not text:
+                    raise ValueError('No text could be extracted (scanned image PDF?)')
+                self.cache.put(sha256, text)
+                error = None
+            except Exception as e:
+                print(f"Text extraction error: {e}")
+                error = str(e)
+            for i in indexes:
+                stored = stored_files[i]
+                results[i] = ({'filename': stored.filename, 'file_hash': sha256, 'error': error}
+                              if error else self._result(stored, text, cached=False))
+        return results
+
+    def _result(self, stored, text, cached):
+        if self.max_chars and len(text) > self.max_chars:
+            text = text[:self.max_chars]
+        return {'filename': stored.filename, 'file_hash': stored.sha256, 'cached': cached, 'resume_text': text}
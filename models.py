@@ -0,0 +1,188 @@
+"""
+Compact data model for interview sessions and responses
+
+Sessions and responses are slotted dataclasses instead of dicts: difficulty and
+status are small int enums, timestamps are epoch floats, and the per-question
+score/time series are stored in `array('d')` buffers rather than lists of
+Python floats. Two serializer pairs are provided:
+
+- to_dict(): API-facing JSON (enum names, ISO timestamps) - same shape as before
+- to_record() / from_record(): compact storage form (int codes, plain lists)
+"""
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import IntEnum
+import sys
+import threading
+import time
+
+MAX_SHARED_TEXT_BYTES = 16 * 1024 * 1024
+MAX_SHARED_TEXT_SIZE = MAX_SHARED_TEXT_BYTES // 16  # larger texts are never shared
+
+_shared_texts = OrderedDict()
+_shared_texts_bytes = 0
+_shared_texts_lock = threading.Lock()
+
+
+class Difficulty(IntEnum):
+    EASY = 0
+    MEDIUM = 1
+    HARD = 2
+
+
+class Status(IntEnum):
+    ACTIVE = 0
+    COMPLETED = 1
+    TERMINATED = 2
+
+
+def share_text(text):
+    """
+    Return one shared copy of a frequently repeated string (e.g. a JD)
+
+    Unlike sys.intern, the table is bounded by memory: the least recently used
+    strings are dropped once the shared copies exceed MAX_SHARED_TEXT_BYTES,
+    so user input cannot pile up for the life of the process. A text over
+    MAX_SHARED_TEXT_SIZE is returned as is rather than evicting many others.
+    """
+    global _shared_texts_bytes
+    size = sys.getsizeof(text)
+    if size > MAX_SHARED_TEXT_SIZE:
+        return text
+    with _shared_texts_lock:
+        shared = _shared_texts.get(text)
+        if shared is None:
+            _shared_texts[text] = shared = text
+            _shared_texts_bytes += size
+            while _shared_texts_bytes > MAX_SHARED_TEXT_BYTES:
+                _, evicted = _shared_texts.popitem(last=False)
+                _shared_texts_bytes -= sys.getsizeof(evicted)
+        else:
+            _shared_texts.move_to_end(text)
+        return shared
+
+
+def _iso(timestamp):
+    """Epoch seconds -> ISO string (None stays None)"""
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp is not None else None
+
+
+@dataclass(slots=True)
+class InterviewResponse:
+    question: str
+    answer: str
+    score: float
+    time_taken: float
+    difficulty: Difficulty
+    feedback: str
+
+    def to_dict(self):
+        return {
+            'question': self.question,
+            'answer': self.answer,
+            'score': self.score,
+            'time_taken': self.time_taken,
+            'difficulty': self.difficulty.name,
+            'feedback': self.feedback
+        }
+
+    def to_record(self):
+        return [self.question, self.answer, self.score, self.time_taken, int(self.difficulty), self.feedback]
+
+    @classmethod
+    def from_record(cls, record):
+        question, answer, score, time_taken, difficulty, feedback = record
+        return cls(question, answer, score, time_taken, Difficulty(difficulty), feedback)
+
+
+@dataclass(slots=True)
+class InterviewSession:
+    session_id: str
+    candidate_id: str
+    job_description: str
+    difficulty: Difficulty = Difficulty.EASY
+    status: Status = Status.ACTIVE
+    fail_streak: int = 0
+    time_used: float = 0.0
+    scores: array = field(default_factory=lambda: array('d'))
+    times: array = field(default_factory=lambda: array('d'))
+    started_at: float = field(default_factory=time.time)
+    ended_at: float = None
+    # Ability estimate, only used by the Elo adaptation policy
+    ability: float = None
+    ability_var: float = None
+    # Early verdict from the adaptation policy: 'PASS', 'FAIL' or None
+    decision: str = None
+
+    def __post_init__(self):
+        # Sessions for the same job usually share one JD - keep a single copy
+        self.job_description = share_text(self.job_description)
+
+    @property
+    def question_count(self):
+        return len(self.scores)
+
+    @property
+    def average_score(self):
+        return round(sum(self.scores) / len(self.scores), 2) if self.scores else 0
+
+    def record_answer(self, score, time_taken):
+        """Append one answered question to the score/time series"""
+        self.scores.append(score)
+        self.times.append(time_taken)
+        self.time_used += time_taken
+
+    def to_dict(self):
+        return {
+            'session_id': self.session_id,
+            'candidate_id': self.candidate_id,
+            'job_description': self.job_description,
+            'difficulty': self.difficulty.name,
+            'question_count': self.question_count,
+            'scores': self.scores.tolist(),
+            'fail_streak': self.fail_streak,
+            'time_used': self.time_used,
+            'status': self.status.name,
+            'started_at': _iso(self.started_at),
+            'ended_at': _iso(self.ended_at),
+            'decision': self.decision
+        }
+
+    def to_record(self):
+        return {
+            'id': self.session_id,
+            'cid': self.candidate_id,
+            'jd': self.job_description,
+            'd': int(self.difficulty),
+            's': int(self.status),
+            'fs': self.fail_streak,
+            'tu': self.time_used,
+            'sc': self.scores.tolist(),
+            'tm': self.times.tolist(),
+            'st': self.started_at,
+            'et': self.ended_at,
+            'ab': self.ability,
+            'av': self.ability_var,
+            'dc': self.decision
+        }
+
+    @classmethod
+    def from_record(cls, record):
+        return cls(
+            session_id=record['id'],
+            candidate_id=record['cid'],
+            job_description=record['jd'],
+            difficulty=Difficulty(record['d']),
+            status=Status(record['s']),
+            fail_streak=record['fs'],
+            time_used=record['tu'],
+            scores=array('d', record['sc']),
+            times=array('d', record['tm']),
+            started_at=record['st'],
+            ended_at=record['et'],
+            ability=record.get('ab'),
+            ability_var=record.get('av'),
+            decision=record.get('dc')
+        )
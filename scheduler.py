@@ -0,0 +1,338 @@
+"""
+Fair-share scheduler for LLM calls
+
+Every call_groq_api() takes a slot from an LLMScheduler before it reaches
+Groq. The scheduler caps in-flight calls per process and decides who goes next:
+
+- Traffic classes are served in strict priority order: LIVE (interview
+  questions/evaluation) > INTERACTIVE (resume tools) > BATCH (bulk uploads).
+  Lower classes may only use part of the slots, and together they never
+  take the last `reserved_live` slots, so live calls find free capacity
+  whatever mix of resume tools and bulk uploads fills the rest (until live
+  traffic alone exceeds the reserve). A class with queued calls and fewer
+  than `min_slots` running holds that many slots back from the classes
+  above it, so batch keeps moving under a steady stream of resume tools.
+- Within a class, tenants (configured API key / client address) share slots
+  by start-time fair queuing: each call gets a virtual start tag, advanced by
+  cost / weight for its tenant, and the smallest tag runs first.
+- Tenants have a per-minute quota (token bucket) on non-live classes.
+- Per-tenant state is swept once more than `max_tenants` are tracked: full
+  buckets, finish tags behind the class's virtual time and idle classes are
+  forgotten, and a class over `max_tenants` finish tags keeps the half
+  furthest ahead.
+- A class whose queue is full, or whose caller waited past the class limit, is
+  shed with SchedulerRejected, which carries a Retry-After estimate.
+
+snapshot() exposes queue depth, in-flight calls, wait-time percentiles and
+shed counts per class.
+"""
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+import hashlib
+import heapq
+import itertools
+import math
+import threading
+import time
+
+
+class TrafficClass(IntEnum):
+    LIVE = 0
+    INTERACTIVE = 1
+    BATCH = 2
+
+
+@dataclass(slots=True)
+class ClassLimits:
+    max_share: float   # fraction of the concurrency this class may occupy
+    max_queue: int     # queued calls before new ones are shed
+    max_wait: float    # seconds a queued call may wait before it is shed
+    min_slots: int = 0  # slots kept from higher non-live classes while this one has queued calls
+
+
+DEFAULT_CLASS_LIMITS = {
+    TrafficClass.LIVE: ClassLimits(max_share=1.0, max_queue=64, max_wait=20.0),
+    TrafficClass.INTERACTIVE: ClassLimits(max_share=0.75, max_queue=32, max_wait=30.0),
+    TrafficClass.BATCH: ClassLimits(max_share=0.5, max_queue=256, max_wait=300.0, min_slots=1),
+}
+
+
+class SchedulerRejected(Exception):
+    """An LLM call was shed (queue full, waited too long, or tenant over quota)"""
+
+    def __init__(self, message, retry_after, reason):
+        super().__init__(message)
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.reason = reason
+
+
+def parse_weights(spec):
+    """'acme=3,beta=0.5' -> {'acme': 3.0, 'beta': 0.5}"""
+    weights = {}
+    for item in (spec or '').split(','):
+        tenant, sep, value = item.partition('=')
+        if sep and tenant.strip():
+            weights[tenant.strip()] = float(value)
+    return weights
+
+
+def parse_tenant_keys(spec):
+    """'acme=key1,beta=key2' -> {sha256(key1): 'acme', sha256(key2): 'beta'}"""
+    tenants = {}
+    for item in (spec or '').split(','):
+        tenant, sep, key = item.partition('=')
+        if sep and tenant.strip() and key.strip():
+            tenants[hashlib.sha256(key.strip().encode()).hexdigest()] = tenant.strip()
+    return tenants
+
+
+class _Ticket:
+    __slots__ = ('traffic_class', 'tenant', 'tag', 'enqueued_at', 'granted', 'cancelled', 'event')
+
+    def __init__(self, traffic_class, tenant, tag):
+        self.traffic_class = traffic_class
+        self.tenant = tenant
+        self.tag = tag
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+        self.cancelled = False
+        self.event = threading.Event()
+
+
+class _TokenBucket:
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated_at')
+
+    def __init__(self, per_minute, burst):
+        self.rate = per_minute / 60.0
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def take(self, cost):
+        """Consume cost tokens; returns 0 on success or the seconds until they are available"""
+        self.refill(time.monotonic())
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+
+class _ClassState:
+    def __init__(self, limits, slots):
+        self.limits = limits
+        self.slots = slots
+        self.heap = []             # (start tag, seq, ticket)
+        self.depth = 0             # queued tickets that are not cancelled
+        self.in_flight = 0
+        self.virtual_time = 0.0
+        self.tenant_finish = {}    # tenant -> virtual finish tag of its last queued call
+        self.waits = deque(maxlen=1000)
+        self.service_time = None   # moving average of call duration (seconds)
+        self.admitted = 0
+        self.completed = 0
+        self.shed = {'queue_full': 0, 'timeout': 0, 'quota': 0}
+
+
+class LLMScheduler:
+    """Priority classes + per-tenant weighted fair queuing in front of the LLM client"""
+
+    def __init__(self, max_concurrency=8, class_limits=None, tenant_weights=None,
+                 tenant_quota_per_minute=0, tenant_quota_burst=None, default_service_time=2.0,
+                 reserved_live=None, max_tenants=1024):
+        self.max_concurrency = max_concurrency
+        if reserved_live is None:
+            reserved_live = max(1, max_concurrency // 4)
+        # Slots only live calls may take; at least one slot stays open to the rest
+        self.reserved_live = max(0, min(reserved_live, max_concurrency - 1))
+        self.tenant_weights = dict(tenant_weights or {})
+        self.tenant_quota_per_minute = tenant_quota_per_minute
+        self.tenant_quota_burst = tenant_quota_burst or max(1, tenant_quota_per_minute // 4)
+        self.default_service_time = default_service_time
+        self.max_tenants = max_tenants
+        limits = {**DEFAULT_CLASS_LIMITS, **(class_limits or {})}
+        self._classes = {
+            traffic_class: _ClassState(limits[traffic_class],
+                                       max(1, int(max_concurrency * limits[traffic_class].max_share)))
+            for traffic_class in TrafficClass
+        }
+        self._in_flight = 0
+        self._buckets = {}
+        self._prune_at = max_tenants  # tenants per table that trigger the next sweep
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    # ----------------------
+    # Slots
+    # ----------------------
+
+    @contextmanager
+    def slot(self, traffic_class=TrafficClass.INTERACTIVE, tenant='default', cost=1.0):
+        """
+        Hold one LLM slot for the duration of the with-block
+
+        Raises:
+            SchedulerRejected: when the call is shed (the caller should answer 429)
+        """
+        traffic_class = TrafficClass(traffic_class)
+        self.acquire(traffic_class, tenant, cost)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(traffic_class, time.monotonic() - started)
+
+    def acquire(self, traffic_class, tenant, cost=1.0):
+        state = self._classes[traffic_class]
+        with self._lock:
+            if state.depth >= state.limits.max_queue:
+                state.shed['queue_full'] += 1
+                raise SchedulerRejected(f'{traffic_class.name.lower()} queue is full',
+                                        self._estimated_wait(state, state.depth), 'queue_full')
+
+            if traffic_class != TrafficClass.LIVE and self.tenant_quota_per_minute:
+                bucket = self._buckets.get(tenant)
+                if bucket is None:
+                    bucket = self._buckets[tenant] = _TokenBucket(self.tenant_quota_per_minute,
+                                                                  self.tenant_quota_burst)
+                wait = bucket.take(cost)
+                if wait:
+                    state.shed['quota'] += 1
+                    raise SchedulerRejected(f'Tenant {tenant} is over its quota of '
+                                            f'{self.tenant_quota_per_minute} LLM calls per minute',
+                                            wait, 'quota')
+
+            if len(self._buckets) > self._prune_at or len(state.tenant_finish) > self.max_tenants:
+                self._prune_tenants()
+
+            # Start-time fair queuing: a tenant's next call starts where its last one finished
+            start = max(state.virtual_time, state.tenant_finish.get(tenant, 0.0))
+            state.tenant_finish[tenant] = start + cost / self.tenant_weights.get(tenant, 1.0)
+            ticket = _Ticket(traffic_class, tenant, start)
+            heapq.heappush(state.heap, (start, next(self._seq), ticket))
+            state.depth += 1
+            self._dispatch()
+
+        if not ticket.event.wait(state.limits.max_wait):
+            with self._lock:
+                if not ticket.granted:
+                    ticket.cancelled = True
+                    state.depth -= 1
+                    state.shed['timeout'] += 1
+                    raise SchedulerRejected(f'Timed out waiting for an LLM slot '
+                                            f'({traffic_class.name.lower()} traffic)',
+                                            self._estimated_wait(state, state.depth), 'timeout')
+
+    def release(self, traffic_class, duration):
+        state = self._classes[traffic_class]
+        with self._lock:
+            self._in_flight -= 1
+            state.in_flight -= 1
+            state.completed += 1
+            state.service_time = (duration if state.service_time is None
+                                  else 0.8 * state.service_time + 0.2 * duration)
+            self._dispatch()
+
+    def _dispatch(self):
+        """Grant free slots to the head of the highest-priority eligible class (lock held)"""
+        live = self._classes[TrafficClass.LIVE]
+        non_live_slots = self.max_concurrency - self.reserved_live
+        while self._in_flight < self.max_concurrency:
+            non_live_free = non_live_slots - (self._in_flight - live.in_flight)
+            # Walk up from the lowest class; the last eligible one has the highest priority
+            state, held_back = None, 0
+            for traffic_class in reversed(TrafficClass):
+                candidate = self._classes[traffic_class]
+                if (candidate.depth and candidate.in_flight < candidate.slots
+                        and (traffic_class == TrafficClass.LIVE or non_live_free > held_back)):
+                    state = candidate
+                if candidate.depth:
+                    # Slots this class is owed under min_slots are held back from the
+                    # classes above it, but those always keep at least one slot
+                    held_back = min(non_live_slots - 1,
+                                    held_back + max(0, candidate.limits.min_slots - candidate.in_flight))
+            if state is None:
+                return
+
+            _, _, ticket = heapq.heappop(state.heap)
+            if ticket.cancelled:
+                continue
+            state.depth -= 1
+            state.in_flight += 1
+            state.admitted += 1
+            state.virtual_time = max(state.virtual_time, ticket.tag)
+            state.waits.append(time.monotonic() - ticket.enqueued_at)
+            self._in_flight += 1
+            ticket.granted = True
+            ticket.event.set()
+
+    def _prune_tenants(self):
+        """Drop the state of idle tenants (lock held)"""
+        now = time.monotonic()
+        for tenant, bucket in list(self._buckets.items()):
+            bucket.refill(now)
+            if bucket.tokens >= bucket.capacity:
+                del self._buckets[tenant]
+        for state in self._classes.values():
+            if not state.depth and not state.in_flight:
+                state.tenant_finish = {}
+                continue
+            # A finish tag at or behind virtual time starts the next call at virtual time anyway
+            finish = {tenant: tag for tenant, tag in state.tenant_finish.items() if tag > state.virtual_time}
+            if len(finish) > self.max_tenants:
+                # Keep the half furthest ahead; the rest lose at most a little priority
+                finish = dict(heapq.nlargest(self.max_tenants // 2, finish.items(), key=lambda item: item[1]))
+            state.tenant_finish = finish
+        # Buckets still refilling belong to active tenants: sweep again once they double
+        self._prune_at = max(self.max_tenants, 2 * len(self._buckets))
+
+    def estimated_wait(self, traffic_class):
+        """Seconds until a call of this class queued now would likely start"""
+        state = self._classes[TrafficClass(traffic_class)]
+        with self._lock:
+            return self._estimated_wait(state, state.depth)
+
+    def _estimated_wait(self, state, queued):
+        service_time = state.service_time or self.default_service_time
+        return (queued + 1) * service_time / state.slots
+
+    # ----------------------
+    # Metrics
+    # ----------------------
+
+    def snapshot(self):
+        """Per-class queue depth, in-flight calls, wait percentiles and shed counts"""
+        with self._lock:
+            classes = {}
+            for traffic_class, state in self._classes.items():
+                waits = sorted(state.waits)
+                classes[traffic_class.name.lower()] = {
+                    'queue_depth': state.depth,
+                    'in_flight': state.in_flight,
+                    'slots': state.slots,
+                    'admitted': state.admitted,
+                    'completed': state.completed,
+                    'shed': dict(state.shed),
+                    'wait_ms_p50': _percentile_ms(waits, 0.5),
+                    'wait_ms_p95': _percentile_ms(waits, 0.95),
+                    'wait_ms_max': _percentile_ms(waits, 1.0),
+                    'service_ms_avg': round(state.service_time * 1000, 1) if state.service_time else None
+                }
+            return {
+                'max_concurrency': self.max_concurrency,
+                'reserved_live': self.reserved_live,
+                'in_flight': self._in_flight,
+                'classes': classes
+            }
+
+
+def _percentile_ms(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return round(sorted_values[index] * 1000, 1)
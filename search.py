@@ -0,0 +1,376 @@
+"""
+Inverted-index candidate search over stored profiles
+
+Each profile from /resume/analyze is indexed under
+- its canonical skills (via the skill taxonomy matcher),
+- the words of its primary_domain and project names,
+- its experience_years (numeric, for range filters).
+
+A query (explicit skills and/or a JD, optional experience range and domain)
+only touches the postings of its own terms, scores candidates by IDF-weighted
+skill coverage plus small domain/project bonuses, and returns the top N.
+
+Persistence is an append-only JSONL log: every add or delete is one line, the
+index is rebuilt by replaying it on first use, and refresh() tails lines
+appended by other worker processes since the last read. Profiles older than
+max_age are dropped, and once most lines are dead (deleted, expired or
+replaced) the log is rewritten with only the live profiles.
+"""
+import contextlib
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: a single worker process, nothing to coordinate with
+    fcntl = None
+
+_WORD_RE = re.compile(r'[a-z0-9][a-z0-9+#.]*')
+_STOPWORDS = frozenset('a an and the of for in on to with by at from or as is are engineer engineering developer '
+                       'development project projects system systems app application'.split())
+
+DOMAIN_BONUS = 10.0
+PROJECT_BONUS = 2.0
+MAX_PROJECT_BONUS = 10.0
+
+EXPIRE_INTERVAL = 3600          # seconds between expiry sweeps
+COMPACT_MIN_DEAD_LINES = 1000   # never rewrite the log for fewer dead lines than this
+
+
+def _terms(text):
+    return {word for word in _WORD_RE.findall(str(text).lower()) if word not in _STOPWORDS and len(word) > 1}
+
+
+def _log_line(record):
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+@contextlib.contextmanager
+def _log_lock(path, exclusive):
+    """Appends share the lock; compaction takes it exclusively while it swaps the file"""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + '.lock', 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _experience(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class CandidateIndex:
+    """In-memory inverted index of candidate profiles with a JSONL persistence log"""
+
+    def __init__(self, skill_matcher, path=None, max_age=None):
+        """
+        Args:
+            skill_matcher: SkillMatcher used to canonicalize profile skills
+            path: Persistence log (None keeps profiles in memory only). It is
+                read on first use, not here, so importing the app stays cheap
+            max_age: Seconds a profile is kept after it was added (None = no expiry)
+        """
+        self.skill_matcher = skill_matcher
+        self.path = path
+        self.max_age = max_age
+        self.profiles = {}        # candidate_id -> profile as stored
+        self._added_at = {}       # candidate_id -> time.time() it was added
+        self._skills = {}         # candidate_id -> frozenset of canonical skills
+        self._skill_postings = {}  # canonical skill -> {candidate_id}
+        self._domain_postings = {}  # domain word -> {candidate_id}
+        self._project_postings = {}  # project word -> {candidate_id}
+        self._years = {}          # candidate_id -> experience_years (numeric)
+        self._loaded = not path
+        self._inode = None        # log file the offset refers to (compaction replaces it)
+        self._offset = 0
+        self._lines = 0           # complete log lines read or written by us
+        self._expired_at = 0.0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            self._ensure_loaded()
+            return len(self.profiles)
+
+    def __contains__(self, candidate_id):
+        return self.get(candidate_id) is not None
+
+    def get(self, candidate_id):
+        """Stored profile, or None"""
+        with self._lock:
+            self._ensure_loaded()
+            return self.profiles.get(candidate_id)
+
+    # ----------------------
+    # Updates
+    # ----------------------
+
+    def add(self, candidate_id, profile):
+        """Index a profile and append it to the persistence log"""
+        with self._lock:
+            self._ensure_loaded()
+            added_at = time.time()
+            self._index(candidate_id, profile, added_at)
+            self._append({'id': candidate_id, 'profile': profile, 'ts': added_at})
+            self._maintain()
+
+    def remove(self, candidate_id):
+        """Delete a profile from the index and the log; False when it is unknown"""
+        with self._lock:
+            self._ensure_loaded()
+            if candidate_id not in self.profiles:
+                return False
+            self._remove(candidate_id)
+            self._append({'id': candidate_id, 'deleted': True, 'ts': time.time()})
+            self._maintain()
+            return True
+
+    def refresh(self):
+        """Replay log lines written since the last read (first use, or by other workers)"""
+        with self._lock:
+            self._loaded = True
+            added = self._read_log()
+            self._maintain()
+            return added
+
+    def compact(self):
+        """Rewrite the log with only the live profiles (drops deletions, expired and replaced lines)"""
+        if not self.path:
+            return
+        with self._lock, _log_lock(self.path, exclusive=True):
+            self._read_log()  # everything other workers appended before we took the lock
+            self._expire()
+            temp_path = self.path + '.compact'
+            with open(temp_path, 'wb') as f:
+                for candidate_id, profile in self.profiles.items():
+                    f.write(_log_line({'id': candidate_id, 'profile': profile,
+                                       'ts': self._added_at[candidate_id]}))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            stat = os.stat(self.path)
+            self._inode, self._offset, self._lines = stat.st_ino, stat.st_size, len(self.profiles)
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._loaded = True
+            self._read_log()
+
+    def _append(self, record):
+        if not self.path:
+            return
+        data = _log_line(record)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with _log_lock(self.path, exclusive=False):
+            # One O_APPEND write per line keeps concurrent workers from interleaving
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+                end = os.lseek(fd, 0, os.SEEK_CUR)
+                inode = os.fstat(fd).st_ino
+            finally:
+                os.close(fd)
+        # Skip our own line on the next refresh() only if it landed right
+        # where we stopped reading; the file size checked before the write
+        # could already be stale by the time the append happened
+        if inode == self._inode and end - len(data) == self._offset:
+            self._offset = end
+            self._lines += 1
+        elif self._inode is None and end == len(data):
+            self._inode, self._offset, self._lines = inode, end, 1
+
+    def _read_log(self):
+        """Apply new log lines (lock held); returns the number of profiles added"""
+        if not self.path:
+            return 0
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return 0
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Another worker compacted the log: rebuild from the new file
+            if self._inode is not None:
+                self._clear()
+            self._inode, self._offset, self._lines = stat.st_ino, 0, 0
+        if stat.st_size <= self._offset:
+            return 0
+
+        added = 0
+        cutoff = time.time() - self.max_age if self.max_age else None
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # partially written line - pick it up next time
+                self._offset += len(raw)
+                self._lines += 1
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError as e:
+                    print(f"Candidate index: skipping corrupt line: {e}")
+                    continue
+                candidate_id = record['id']
+                if record.get('deleted'):
+                    if candidate_id in self.profiles:
+                        self._remove(candidate_id)
+                    continue
+                # Lines written before profiles carried a timestamp count from now
+                added_at = record.get('ts') or time.time()
+                if candidate_id not in self.profiles and (cutoff is None or added_at >= cutoff):
+                    self._index(candidate_id, record['profile'], added_at)
+                    added += 1
+        return added
+
+    def _maintain(self):
+        """Expire old profiles hourly and compact once most log lines are dead (lock held)"""
+        if self.max_age and time.time() - self._expired_at > EXPIRE_INTERVAL:
+            self._expire()
+        if self.path and self._lines - len(self.profiles) > max(COMPACT_MIN_DEAD_LINES, len(self.profiles)):
+            self.compact()
+
+    def _expire(self):
+        self._expired_at = time.time()
+        if not self.max_age:
+            return
+        cutoff = self._expired_at - self.max_age
+        for candidate_id in [cid for cid, added_at in self._added_at.items() if added_at < cutoff]:
+            self._remove(candidate_id)
+
+    def _clear(self):
+        for candidate_id in list(self.profiles):
+            self._remove(candidate_id)
+
+    def _index(self, candidate_id, profile, added_at):
+        if candidate_id in self.profiles:
+            self._remove(candidate_id)
+
+        skills = self.skill_matcher.canonicalize(profile.get('skills', []))
+        self.profiles[candidate_id] = profile
+        self._added_at[candidate_id] = added_at
+        self._skills[candidate_id] = frozenset(skills)
+        for skill in skills:
+            self._skill_postings.setdefault(skill, set()).add(candidate_id)
+        for word in _terms(profile.get('primary_domain', '')):
+            self._domain_postings.setdefault(word, set()).add(candidate_id)
+        for project in profile.get('projects', []) or []:
+            for word in _terms(project):
+                self._project_postings.setdefault(word, set()).add(candidate_id)
+        self._years[candidate_id] = _experience(profile.get('experience_years'))
+
+    def _remove(self, candidate_id):
+        profile = self.profiles.pop(candidate_id)
+        self._added_at.pop(candidate_id, None)
+        for skill in self._skills.pop(candidate_id, []):
+            self._discard(self._skill_postings, skill, candidate_id)
+        for word in _terms(profile.get('primary_domain', '')):
+            self._discard(self._domain_postings, word, candidate_id)
+        for project in profile.get('projects', []) or []:
+            for word in _terms(project):
+                self._discard(self._project_postings, word, candidate_id)
+        self._years.pop(candidate_id, None)
+
+    @staticmethod
+    def _discard(postings, term, candidate_id):
+        ids = postings.get(term)
+        if ids is not None:
+            ids.discard(candidate_id)
+            if not ids:
+                del postings[term]
+
+    # ----------------------
+    # Queries
+    # ----------------------
+
+    def search(self, skills=None, job_description='', min_experience=None, max_experience=None,
+               domain='', limit=10):
+        """
+        Top-N candidates for a skill list and/or job description
+
+        Args:
+            skills: Free-form skill names (canonicalized through the taxonomy)
+            job_description: JD text; its skills and words are added to the query
+            min_experience / max_experience: Inclusive experience_years range
+            domain: Preferred domain text (e.g. "Backend Engineering")
+            limit: Number of results
+
+        Returns:
+            tuple: (results list, number of candidates that matched the query)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            query_skills = self.skill_matcher.canonicalize(skills or [])
+            for skill in self.skill_matcher.extract(job_description):
+                if skill not in query_skills:
+                    query_skills.append(skill)
+            domain_terms = _terms(domain) | (_terms(job_description) & self._domain_postings.keys())
+            project_terms = _terms(job_description) & self._project_postings.keys()
+
+            total = len(self.profiles) or 1
+            # Rare skills weigh more (IDF); skills nobody has still count as missing
+            weights = {skill: math.log(1 + total / max(1, len(self._skill_postings.get(skill, ()))))
+                       for skill in query_skills}
+            total_weight = sum(weights.values()) or 1.0
+
+            # Accumulate scores along the postings lists - cost is the size of
+            # the postings touched, not the number of indexed candidates
+            scores = {}
+            for skill in query_skills:
+                contribution = 100.0 * weights[skill] / total_weight
+                for candidate_id in self._skill_postings.get(skill, ()):
+                    scores[candidate_id] = scores.get(candidate_id, 0.0) + contribution
+            domain_matches = set()
+            for term in domain_terms:
+                domain_matches |= self._domain_postings.get(term, set())
+            for candidate_id in domain_matches:
+                scores[candidate_id] = scores.get(candidate_id, 0.0) + DOMAIN_BONUS
+            project_hits = {}
+            for term in project_terms:
+                for candidate_id in self._project_postings[term]:
+                    project_hits[candidate_id] = project_hits.get(candidate_id, 0) + 1
+            for candidate_id, hits in project_hits.items():
+                if candidate_id in scores:
+                    scores[candidate_id] += min(MAX_PROJECT_BONUS, PROJECT_BONUS * hits)
+
+            if not (skills or job_description or domain):
+                # No query terms at all: browse by the experience filter alone.
+                # Terms that matched nothing give an empty result instead.
+                scores = dict.fromkeys(self.profiles, 0.0)
+            if min_experience is not None or max_experience is not None:
+                low = min_experience if min_experience is not None else float('-inf')
+                high = max_experience if max_experience is not None else float('inf')
+                years = self._years
+                scores = {candidate_id: score for candidate_id, score in scores.items()
+                          if low <= years[candidate_id] <= high}
+
+            years = self._years
+            top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], years[item[0]]))
+
+            results = []
+            for candidate_id, score in top:
+                profile = self.profiles[candidate_id]
+                candidate_skills = self._skills[candidate_id]
+                matched = [skill for skill in query_skills if skill in candidate_skills]
+                results.append({
+                    'candidate_id': candidate_id,
+                    'score': round(score, 2),
+                    'matched_skills': matched,
+                    'missing_skills': [skill for skill in query_skills if skill not in candidate_skills],
+                    'skills': profile.get('skills', []),
+                    'experience_years': profile.get('experience_years', 0),
+                    'primary_domain': profile.get('primary_domain', ''),
+                    'projects': profile.get('projects', [])
+                })
+            return results, len(scores)
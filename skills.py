@@ -0,0 +1,332 @@
+"""
+Skill taxonomy and trie-based skill matcher
+
+SKILL_TAXONOMY maps each canonical skill to its aliases ("k8s" -> "Kubernetes").
+All aliases are compiled into one token trie, so extracting skills from a
+resume or JD is a single linear pass over its tokens regardless of the
+taxonomy size. Only whole tokens match. Skills that are also ordinary English
+words need more evidence (see CAPITALIZED_ALIASES and CONTEXT_ALIASES), and
+aliases that are mostly something else ("oracle", "ts", "spark") are left out.
+
+skill_overlap() computes the deterministic /resume/match-jd fields
+(matched_skills, missing_skills, skill_match_percentage) locally.
+"""
+import json
+import os
+import re
+
+SKILL_TAXONOMY = {
+    # Languages
+    'Python': ['python', 'python3', 'py3'],
+    'Java': ['java', 'java8', 'java 8', 'java 11', 'java 17'],
+    'JavaScript': ['javascript', 'java script', 'js', 'es6', 'ecmascript'],
+    'TypeScript': ['typescript'],
+    'Go': ['golang', 'go lang', 'Go'],
+    'Rust': ['rust', 'rustlang'],
+    'C': ['C', 'c language', 'c programming', 'ansi c'],
+    'C++': ['c++', 'cpp', 'cplusplus', 'c plus plus'],
+    'C#': ['c#', 'csharp', 'c sharp'],
+    'Ruby': ['ruby'],
+    'PHP': ['php'],
+    'Kotlin': ['kotlin'],
+    'Swift': [],
+    'Scala': ['scala'],
+    'R': ['R', 'r language', 'r programming', 'rstudio'],
+    'MATLAB': ['matlab'],
+    'Perl': ['perl'],
+    'Dart': ['dart'],
+    'Bash': ['bash', 'shell scripting', 'shell script', 'sh scripting', 'zsh'],
+    'SQL': ['sql', 'structured query language'],
+    'HTML': ['html', 'html5'],
+    'CSS': ['css', 'css3'],
+    # Frontend
+    'React': ['react', 'react.js', 'reactjs', 'react js'],
+    'React Native': ['react native', 'react-native'],
+    'Angular': ['angular', 'angularjs', 'angular.js'],
+    'Vue.js': ['vue', 'vue.js', 'vuejs'],
+    'Svelte': ['svelte', 'sveltekit'],
+    'Next.js': ['next.js', 'nextjs', 'next js'],
+    'Redux': ['redux', 'redux toolkit'],
+    'Tailwind CSS': ['tailwind', 'tailwindcss', 'tailwind css'],
+    'Bootstrap': ['bootstrap'],
+    'Sass': ['sass', 'scss'],
+    'Webpack': ['webpack'],
+    'Vite': ['vite'],
+    'jQuery': ['jquery'],
+    'Flutter': ['flutter'],
+    # Backend
+    'Node.js': ['node.js', 'nodejs', 'node js'],
+    'Express.js': ['expressjs'],
+    'Django': ['django'],
+    'Flask': ['flask'],
+    'FastAPI': ['fastapi', 'fast api'],
+    'Spring Boot': ['springboot', 'spring framework', 'spring mvc'],
+    'Ruby on Rails': ['ruby on rails', 'ror'],
+    'Laravel': ['laravel'],
+    '.NET': ['.net', 'dotnet', 'asp.net', '.net core', 'dot net'],
+    'GraphQL': ['graphql', 'graph ql'],
+    'REST APIs': ['rest api', 'rest apis', 'restful', 'restful api', 'restful apis', 'restful services'],
+    'gRPC': ['grpc'],
+    'Microservices': ['microservices', 'microservice', 'micro services', 'microservice architecture'],
+    'WebSockets': ['websocket', 'websockets', 'socket.io'],
+    # Data stores
+    'PostgreSQL': ['postgresql', 'postgres', 'psql'],
+    'MySQL': ['mysql'],
+    'SQLite': ['sqlite'],
+    'Oracle Database': ['oracle db', 'oracle database', 'pl/sql', 'plsql'],
+    'SQL Server': ['sql server', 'mssql', 'ms sql', 't-sql', 'tsql'],
+    'MongoDB': ['mongodb', 'mongo', 'mongoose'],
+    'Redis': ['redis'],
+    'Cassandra': ['cassandra'],
+    'DynamoDB': ['dynamodb', 'dynamo db'],
+    'Elasticsearch': ['elasticsearch', 'elastic search', 'elk', 'opensearch'],
+    'Firebase': ['firebase', 'firestore'],
+    'Snowflake': ['snowflake'],
+    'BigQuery': ['bigquery', 'big query'],
+    # Cloud / DevOps
+    'AWS': ['aws', 'amazon web services', 'ec2', 's3', 'aws lambda'],
+    'Azure': ['azure', 'microsoft azure'],
+    'Google Cloud': ['gcp', 'google cloud', 'google cloud platform'],
+    'Docker': ['docker', 'dockerfile', 'docker compose', 'docker-compose'],
+    'Kubernetes': ['kubernetes', 'k8s', 'kubectl', 'eks', 'aks', 'gke'],
+    'Terraform': ['terraform', 'hcl'],
+    'Ansible': ['ansible'],
+    'Jenkins': ['jenkins'],
+    'GitHub Actions': ['github actions'],
+    'GitLab CI': ['gitlab ci', 'gitlab-ci', 'gitlab ci/cd'],
+    'CI/CD': ['ci/cd', 'cicd', 'ci cd', 'continuous integration', 'continuous delivery', 'continuous deployment'],
+    'Linux': ['linux', 'unix', 'ubuntu', 'centos', 'rhel'],
+    'Nginx': ['nginx'],
+    'Git': ['git', 'github', 'gitlab', 'bitbucket'],
+    'Prometheus': ['prometheus'],
+    'Grafana': ['grafana'],
+    'Serverless': ['serverless'],
+    # Data / ML
+    'Machine Learning': ['machine learning'],
+    'Deep Learning': ['deep learning', 'neural networks', 'neural network'],
+    'NLP': ['nlp', 'natural language processing'],
+    'Computer Vision': ['computer vision', 'cv models', 'image recognition'],
+    'LLMs': ['llm', 'llms', 'large language models', 'large language model', 'generative ai', 'genai'],
+    'TensorFlow': ['tensorflow', 'tensor flow', 'keras'],
+    'PyTorch': ['pytorch'],
+    'scikit-learn': ['scikit-learn', 'scikit learn', 'sklearn'],
+    'Pandas': ['pandas'],
+    'NumPy': ['numpy'],
+    'Apache Spark': ['apache spark', 'pyspark', 'spark sql', 'spark streaming'],
+    'Hadoop': ['hadoop', 'hdfs', 'mapreduce'],
+    'Kafka': ['kafka', 'apache kafka'],
+    'RabbitMQ': ['rabbitmq', 'rabbit mq'],
+    'Airflow': ['airflow', 'apache airflow'],
+    'Data Analysis': ['data analysis', 'data analytics'],
+    'Data Visualization': ['data visualization', 'data visualisation'],
+    'Tableau': ['tableau'],
+    'Power BI': ['power bi', 'powerbi'],
+    'Excel': ['ms excel', 'microsoft excel'],
+    'Statistics': ['statistics', 'statistical analysis'],
+    'ETL': ['etl', 'elt', 'data pipelines', 'data pipeline'],
+    # Practices
+    'System Design': ['system design', 'distributed systems', 'scalable systems'],
+    'Data Structures': ['data structures', 'data structure'],
+    'Algorithms': ['algorithms', 'algorithm design'],
+    'Object-Oriented Programming': ['oop', 'object oriented programming', 'object-oriented programming',
+                                    'object oriented design', 'ood'],
+    'Unit Testing': ['unit testing', 'unit tests', 'tdd', 'test driven development'],
+    'pytest': ['pytest'],
+    'Jest': ['jest'],
+    'Selenium': ['selenium'],
+    'Cypress': ['cypress'],
+    'Agile': ['agile', 'scrum', 'kanban'],
+    'Application Security': ['cybersecurity', 'cyber security', 'application security', 'owasp'],
+    'OAuth': ['oauth', 'oauth2', 'oauth 2.0', 'openid connect', 'jwt'],
+    'Figma': ['figma'],
+    'UI/UX': ['ui/ux', 'ux design', 'ui design', 'user experience'],
+    'Communication': ['communication skills', 'communication'],
+    'Leadership': ['leadership', 'team lead', 'mentoring'],
+}
+
+# Single-word skills that are also ordinary words ("react to", "a flask").
+# They match when capitalized as written, or in any casing inside a skill list.
+CAPITALIZED_ALIASES = frozenset({'React', 'Rust', 'Dart', 'Flask', 'Jest', 'Cypress', 'Bootstrap',
+                                 'Snowflake', 'Sass'})
+# Letters and words that are far more often something else ("Go to market",
+# "grade C", "R&D", "I excel at", "swift results"). They must be capitalized
+# *and* sit in a skill list or next to a word like "programming".
+CONTEXT_ALIASES = frozenset({'Go', 'C', 'R', 'Excel', 'Swift'})
+_GUARDED_LOWER = frozenset(alias.lower() for alias in CAPITALIZED_ALIASES | CONTEXT_ALIASES)
+
+# What may surround a guarded alias for it to count as listed
+_LIST_BEFORE = frozenset(',;:/(|\n')
+_LIST_AFTER = frozenset(',;/)|.\n')
+_LINE_BULLETS = '-*•·▪ \t'
+_WORDS_BEFORE = frozenset({'in', 'with', 'using', 'and', 'or'})
+_WORDS_AFTER = frozenset({'and', 'or', 'programming', 'language', 'developer', 'developers',
+                          'engineer', 'engineers', 'experience', 'code'})
+
+# Words keep inner '.', '-' and trailing '+'/'#' ("node.js", "t-sql", "c++", "c#", ".net");
+# '/' is a token of its own so "ci/cd" and "Node.js/React" both tokenize sensibly
+_TOKEN_RE = re.compile(r'\.?[^\W_][\w+#]*(?:[.\-][^\W_][\w+#]*)*|/')
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text)
+
+
+class SkillMatcher:
+    """Token trie over all skill aliases"""
+
+    def __init__(self, taxonomy=None):
+        taxonomy = taxonomy if taxonomy is not None else SKILL_TAXONOMY
+        self.canonical_names = list(taxonomy)
+        self._lookup = {}  # normalized alias or canonical name -> canonical index
+        self._exact = {}   # guarded alias as written -> (canonical index, needs list context)
+        self._listed = {}  # lowercased CAPITALIZED_ALIASES -> canonical index (list context only)
+        self._trie = {}    # token -> [children, canonical index or None]
+
+        for index, canonical in enumerate(self.canonical_names):
+            for alias in dict.fromkeys([canonical] + list(taxonomy[canonical])):
+                if alias in CAPITALIZED_ALIASES or alias in CONTEXT_ALIASES:
+                    self._exact.setdefault(alias, (index, alias in CONTEXT_ALIASES))
+                    if alias in CAPITALIZED_ALIASES:
+                        self._listed.setdefault(alias.lower(), index)
+                    self._lookup.setdefault(alias.lower(), index)
+                    continue
+                tokens = tokenize(alias.lower())
+                key = ' '.join(tokens)
+                if not tokens or key in _GUARDED_LOWER or key in self._lookup:
+                    continue
+                self._lookup[key] = index
+                self._add(tokens, index)
+
+    def _add(self, tokens, index):
+        children = self._trie
+        for token in tokens[:-1]:
+            children = children.setdefault(token, [{}, None])[0]
+        entry = children.setdefault(tokens[-1], [{}, None])
+        if entry[1] is None:
+            entry[1] = index
+
+    def extract(self, text):
+        """
+        Canonical skills mentioned in `text`, in order of first appearance
+
+        The text is tokenized once (regex, in C) and the trie is walked from
+        each token; aliases are at most a few tokens long, so this is a single
+        linear pass whatever the taxonomy size. Whole tokens must match, so
+        "java" does not match "javascript", and the longest alias starting at
+        a token wins and consumes its tokens ("SQL Server" is not also "SQL").
+        """
+        if not text:
+            return []
+        tokens = tokenize(text)
+        spans = None  # token positions in text, only needed for guarded aliases
+        lowered = [token.lower() for token in tokens]
+        trie, exact, listed = self._trie, self._exact, self._listed
+        count = len(lowered)
+        found = {}
+
+        position = 0
+        while position < count:
+            # Deepest alias reachable from this token
+            index, end = None, position
+            entry = trie.get(lowered[position])
+            cursor = position
+            while entry is not None:
+                cursor += 1
+                if entry[1] is not None:
+                    index, end = entry[1], cursor
+                if cursor >= count:
+                    break
+                entry = entry[0].get(lowered[cursor])
+
+            # Guarded aliases are single tokens and never in the trie
+            if index is None:
+                hit = exact.get(tokens[position])
+                if hit is None and lowered[position] in listed:
+                    hit = (listed[lowered[position]], True)
+                if hit is not None:
+                    if hit[1] and spans is None:
+                        spans = list(_TOKEN_RE.finditer(text))
+                    if not hit[1] or _listed_at(text, spans, position):
+                        index, end = hit[0], position + 1
+
+            if index is None:
+                position += 1
+                continue
+            found.setdefault(index, position)
+            position = end
+
+        return [self.canonical_names[index] for index in sorted(found, key=found.get)]
+
+    def canonicalize(self, skills):
+        """Map free-form skill names (e.g. from the LLM profile) onto canonical names"""
+        canonical = []
+        for skill in skills or []:
+            key = ' '.join(tokenize(str(skill).lower()))
+            if key in self._lookup:
+                names = [self.canonical_names[self._lookup[key]]]
+            else:
+                names = self.extract(str(skill))
+            for name in names:
+                if name not in canonical:
+                    canonical.append(name)
+        return canonical
+
+
+def _listed_at(text, spans, position):
+    """
+    True when the token at `position` reads like an item in a skill list: on
+    both sides either list punctuation / a line edge, or a connecting word
+    ("with Go and Rust", "C programming", "Languages: Go, R")
+    """
+    start, end = spans[position].span()
+
+    before = text[:start].rstrip(_LINE_BULLETS)
+    if before and before[-1] not in _LIST_BEFORE:
+        previous = spans[position - 1] if position else None
+        if previous is None or previous.group().lower() not in _WORDS_BEFORE or previous.end() != len(before):
+            return False
+
+    after = text[end:].lstrip(' \t')
+    if after and after[0] not in _LIST_AFTER:
+        following = spans[position + 1] if position + 1 < len(spans) else None
+        if following is None or following.group().lower() not in _WORDS_AFTER or following.start() != len(text) - len(after):
+            return False
+    return True
+
+
+def load_taxonomy(path=None):
+    """Built-in taxonomy, extended/overridden by a JSON file {canonical: [aliases]} if given"""
+    taxonomy = {name: list(aliases) for name, aliases in SKILL_TAXONOMY.items()}
+    if path and os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            for name, aliases in json.load(f).items():
+                taxonomy.setdefault(name, [])
+                taxonomy[name].extend(alias for alias in aliases if alias not in taxonomy[name])
+    return taxonomy
+
+
+def skill_overlap(matcher, resume_text, job_description, profile_skills=None):
+    """
+    Deterministic skill-match fields for /resume/match-jd
+
+    Returns:
+        dict: matched_skills, missing_skills, skill_match_percentage, jd_skills, resume_skills.
+        skill_match_percentage is None when the JD names no taxonomy skills.
+    """
+    jd_skills = matcher.extract(job_description)
+    resume_skills = matcher.extract(resume_text)
+    for skill in matcher.canonicalize(profile_skills):
+        if skill not in resume_skills:
+            resume_skills.append(skill)
+
+    resume_set = set(resume_skills)
+    matched = [skill for skill in jd_skills if skill in resume_set]
+    missing = [skill for skill in jd_skills if skill not in resume_set]
+
+    return {
+        'matched_skills': matched,
+        'missing_skills': missing,
+        'skill_match_percentage': round(100 * len(matched) / len(jd_skills)) if jd_skills else None,
+        'jd_skills': jd_skills,
+        'resume_skills': resume_skills,
+    }
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from adaptation import EloPolicy, StepPolicy
+from models import Difficulty, InterviewSession
+
+
+def replay_scalar(policy, scores):
+    """Per-answer trace of update() as app.py calls it"""
+    session = InterviewSession('s', 'c', 'jd')
+    trace = []
+    for score in scores:
+        session.record_answer(score, 30.0)
+        decision = policy.update(session, score)
+        trace.append((decision, session.ability, session.ability_var))
+        session.difficulty = decision.difficulty
+        session.fail_streak = decision.fail_streak
+        if decision.decided:
+            break
+    return trace
+
+
+def replay_batch(policy, score_rows):
+    n = len(score_rows)
+    state = {
+        'difficulty': np.full(n, int(Difficulty.EASY)),
+        'fail_streak': np.zeros(n, dtype=int),
+        'ability': np.full(n, getattr(policy, 'prior_mean', 0.0)),
+        'ability_var': np.full(n, getattr(policy, 'prior_var', 1.0)),
+        'count': np.zeros(n, dtype=int),
+    }
+    steps = []
+    for column in range(score_rows.shape[1]):
+        state['count'] = state['count'] + 1
+        terminated, decided_pass = policy.update_batch(state, score_rows[:, column])
+        steps.append(({key: value.copy() for key, value in state.items()}, terminated, decided_pass))
+    return steps
+
+
+@pytest.mark.parametrize('policy', [EloPolicy(), StepPolicy()], ids=['elo', 'step'])
+def test_update_batch_matches_update(policy):
+    rng = np.random.default_rng(7)
+    score_rows = rng.integers(0, 101, size=(200, 10)).astype(float)
+    steps = replay_batch(policy, score_rows)
+
+    for row, scores in enumerate(score_rows):
+        for index, (decision, ability, ability_var) in enumerate(replay_scalar(policy, scores)):
+            state, terminated, decided_pass = steps[index]
+            assert decision.difficulty == state['difficulty'][row]
+            assert decision.fail_streak == state['fail_streak'][row]
+            assert (decision.status == 'TERMINATED') == terminated[row]
+            assert decision.decided == (terminated[row] or decided_pass[row])
+            if ability is not None:
+                assert ability == pytest.approx(state['ability'][row])
+                assert ability_var == pytest.approx(state['ability_var'][row])
+
+
+def test_elo_stops_early_on_clear_results():
+    policy = EloPolicy()
+    strong = replay_scalar(policy, [95.0] * 10)
+    weak = replay_scalar(policy, [5.0] * 10)
+
+    assert strong[-1][0].decided and strong[-1][0].status == 'CLEARED'
+    assert weak[-1][0].status == 'TERMINATED'
+    assert len(strong) < 10 and len(weak) < 10
+    assert len(strong) >= policy.min_questions
@@ -0,0 +1,50 @@
+import io
+import os
+import threading
+
+import pytest
+
+# app.py reads its configuration at import time
+os.environ.setdefault('GROQ_API_KEY', 'test-key')
+os.environ['CANDIDATE_INDEX_PATH'] = ''
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+def test_resume_tools_get_429_when_their_threads_are_taken(client, monkeypatch):
+    gate = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(app_module, 'non_live_requests', gate)
+    gate.acquire()   # another resume tool holds the only thread
+
+    response = client.post('/resume/rewrite', json={'resume_text': 'a', 'job_description': 'b'})
+    assert response.status_code == 429
+    assert response.json['reason'] == 'busy'
+    assert int(response.headers['Retry-After']) >= 1
+
+    # Interview routes are never gated
+    assert client.get('/interview/next-question?session_id=missing').status_code != 429
+    gate.release()
+
+
+def test_delete_candidate(client):
+    app_module.candidate_index.add('to-delete', {'skills': ['Python'], 'primary_domain': 'Backend',
+                                                 'experience_years': 2, 'projects': []})
+
+    response = client.delete('/candidates/to-delete')
+    assert response.status_code == 200
+    assert response.json == {'deleted': 'to-delete'}
+    assert app_module.candidate_index.get('to-delete') is None
+    assert client.delete('/candidates/to-delete').status_code == 404
+
+
+def test_upload_over_max_content_length_gets_413(client, monkeypatch):
+    monkeypatch.setitem(app_module.app.config, 'MAX_CONTENT_LENGTH', 1024)
+
+    response = client.post('/resume/upload', data={'file': (io.BytesIO(b'x' * 4096), 'resume.txt')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 413
@@ -0,0 +1,55 @@
+from dedup import QuestionDeduplicator, QuestionIndex
+
+
+def test_core_terms_are_not_reported_as_covered_topics():
+    deduplicator = QuestionDeduplicator()
+    index = QuestionIndex(core_terms=['Python', 'Kubernetes'])
+    question = 'How would you profile a slow Python service running on Kubernetes?'
+    reason, signatures = deduplicator.check(index, 'Backend', question)
+    deduplicator.record(index, 'Backend', question, signatures)
+
+    assert reason is None
+    assert 'python' not in index.topics and 'kubernetes' not in index.topics
+    assert 'profile' in index.topics
+
+
+def test_rephrased_question_is_rejected_in_the_same_session():
+    deduplicator = QuestionDeduplicator()
+    index = QuestionIndex()
+    question = 'Explain how Python generators work and when you would use one.'
+    _, signatures = deduplicator.check(index, 'Backend', question)
+    deduplicator.record(index, 'Backend', question, signatures)
+
+    reason, _ = deduplicator.check(index, 'Backend',
+                                   'Explain how Python generators work and when you would use them.')
+    assert reason == 'already asked in this session'
+    assert deduplicator.check(index, 'Backend', 'Describe a database index you designed.')[0] is None
+
+
+def test_domain_repeat_limit_applies_across_sessions():
+    deduplicator = QuestionDeduplicator(domain_repeat_limit=2)
+    question = 'What is the difference between a process and a thread?'
+    for _ in range(2):
+        index = QuestionIndex()
+        reason, signatures = deduplicator.check(index, 'Backend', question)
+        assert reason is None
+        deduplicator.record(index, 'Backend', question, signatures)
+
+    assert deduplicator.check(QuestionIndex(), 'Backend', question)[0] == 'asked 2+ times in Backend'
+    assert deduplicator.check(QuestionIndex(), 'Frontend', question)[0] is None
+
+
+def test_distinct_questions_sharing_the_roles_skills_are_accepted():
+    deduplicator = QuestionDeduplicator()
+    index = QuestionIndex(core_terms=['Flask', 'REST API'])
+    question = 'How do you handle errors in a REST API built with Flask?'
+    _, signatures = deduplicator.check(index, 'Backend', question)
+    deduplicator.record(index, 'Backend', question, signatures)
+
+    assert deduplicator.check(index, 'Backend', 'How do you version a REST API built with Flask?')[0] is None
+    assert deduplicator.check(index, 'Backend',
+                              'How do you handle errors in a REST API built using Flask?')[0] is not None
+    # A question made only of core skills is still compared on them
+    _, signatures = deduplicator.check(index, 'Backend', 'Flask REST API?')
+    deduplicator.record(index, 'Backend', 'Flask REST API?', signatures)
+    assert deduplicator.check(index, 'Backend', 'REST API in Flask?')[0] == 'already asked in this session'
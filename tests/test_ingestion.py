@@ -0,0 +1,104 @@
+import os
+import time
+import zipfile
+from concurrent.futures import Future
+
+import pytest
+
+from ingestion import IngestionPipeline, StoredFile, TextCache, expand_zip, normalize_text
+
+
+def make_zip(path, members):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def test_zip_member_count_limit(tmp_path):
+    path = make_zip(tmp_path / 'bulk.zip', {f'{i}.txt': 'resume' for i in range(3)})
+    with pytest.raises(ValueError, match='limit is 2'):
+        expand_zip(path, str(tmp_path), max_files=2)
+
+
+def test_zip_size_limits_are_checked_while_streaming(tmp_path):
+    out = tmp_path / 'out'
+    out.mkdir()
+    path = make_zip(tmp_path / 'bulk.zip', {
+        'big.txt': b'x' * 5000,  # compresses to almost nothing
+        'a.txt': b'a' * 600,
+        'b.txt': b'b' * 600,
+        'photo.png': b'png',
+        '__MACOSX/a.txt': b'junk',
+    })
+
+    stored, skipped = expand_zip(path, str(out), max_file_bytes=1000, max_total_bytes=1000)
+
+    assert [f.filename for f in stored] == ['a.txt']
+    assert {s['filename'] for s in skipped} == {'big.txt', 'b.txt', 'photo.png'}
+    # Rejected members leave nothing behind
+    assert os.listdir(out) == [os.path.basename(stored[0].path)]
+
+
+def test_normalize_text_strips_headers_and_boilerplate():
+    pages = [
+        'ACME Resume Services\nJane Doe\nPython devel-\noper\nPage 1 of 3',
+        'ACME Resume Services\n•  Built APIs\n\n\n- 2 -',
+        'ACME Resume Services\nReferences available upon request\nPage 3 of 3',
+    ]
+
+    assert normalize_text(pages) == 'ACME Resume Services\nJane Doe\nPython developer\n- Built APIs'
+
+
+def test_text_cache_expires_old_entries(tmp_path):
+    cache = TextCache(str(tmp_path), max_age=60)
+    cache.put('old', 'old text')
+    cache.put('new', 'new text')
+    stale = time.time() - 120
+    os.utime(cache._path('old'), (stale, stale))
+
+    assert cache.get('old') is None
+    assert not os.path.exists(cache._path('old'))
+    assert cache.get('new') == 'new text'
+
+
+def test_text_cache_prunes_least_recently_used_first(tmp_path):
+    cache = TextCache(str(tmp_path), max_bytes=25, max_age=None)
+    for i, sha256 in enumerate(['a', 'b', 'c']):
+        cache.put(sha256, sha256 * 10)
+        os.utime(cache._path(sha256), (1000 + i, 1000 + i))
+    cache.get('a')  # used most recently now
+
+    cache.prune()
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 'a' * 10
+    assert cache.get('c') == 'c' * 10
+
+
+class HungPool:
+    """Pool whose tasks never finish"""
+
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_running_or_notify_cancel()
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_extraction_timeout_fails_the_file_and_replaces_the_pool(tmp_path):
+    pipeline = IngestionPipeline(str(tmp_path / 'cache'), extract_timeout=0.05)
+    hung = HungPool()
+    pipeline._pool, pipeline._pool_pid = hung, os.getpid()
+    resume = tmp_path / 'resume.txt'
+    resume.write_text('Jane Doe')
+
+    [result] = pipeline.extract([StoredFile('resume.txt', str(resume), 'abc', 8)])
+
+    assert 'timed out' in result['error']
+    assert hung.shut_down and pipeline._pool is None
@@ -0,0 +1,99 @@
+import json
+import sys
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+
+import pytest
+
+import models
+from models import Difficulty, InterviewResponse, InterviewSession, Status, share_text
+
+
+@pytest.fixture
+def session():
+    session = InterviewSession(session_id='s1', candidate_id='c1', job_description='Backend Python role',
+                               started_at=1700000000.0)
+    session.record_answer(80.0, 30.0)
+    session.record_answer(45.5, 60.0)
+    session.difficulty = Difficulty.MEDIUM
+    session.status = Status.COMPLETED
+    session.fail_streak = 1
+    session.ended_at = 1700000600.0
+    session.ability, session.ability_var, session.decision = 0.4, 0.2, 'PASS'
+    return session
+
+
+def test_session_record_round_trip(session):
+    # Records go through JSON when stored
+    restored = InterviewSession.from_record(json.loads(json.dumps(session.to_record())))
+
+    assert restored == session
+    assert isinstance(restored.scores, array) and isinstance(restored.times, array)
+    assert restored.difficulty is Difficulty.MEDIUM and restored.status is Status.COMPLETED
+
+
+def test_session_record_without_adaptation_fields():
+    record = InterviewSession('s2', 'c2', 'JD').to_record()
+    for key in ('ab', 'av', 'dc'):
+        del record[key]
+
+    restored = InterviewSession.from_record(record)
+    assert restored.ability is None and restored.decision is None
+
+
+def test_session_to_dict_api_shape(session):
+    assert session.to_dict() == {
+        'session_id': 's1',
+        'candidate_id': 'c1',
+        'job_description': 'Backend Python role',
+        'difficulty': 'MEDIUM',
+        'question_count': 2,
+        'scores': [80.0, 45.5],
+        'fail_streak': 1,
+        'time_used': 90.0,
+        'status': 'COMPLETED',
+        'started_at': datetime.fromtimestamp(1700000000.0).isoformat(),
+        'ended_at': datetime.fromtimestamp(1700000600.0).isoformat(),
+        'decision': 'PASS'
+    }
+    assert InterviewSession('s2', 'c2', 'JD').to_dict()['ended_at'] is None
+
+
+def test_response_round_trip_and_api_shape():
+    response = InterviewResponse('Q?', 'A.', 72.0, 41.5, Difficulty.HARD, 'Good')
+
+    assert InterviewResponse.from_record(json.loads(json.dumps(response.to_record()))) == response
+    assert response.to_dict() == {'question': 'Q?', 'answer': 'A.', 'score': 72.0, 'time_taken': 41.5,
+                                  'difficulty': 'HARD', 'feedback': 'Good'}
+
+
+@pytest.fixture
+def shared_texts(monkeypatch):
+    monkeypatch.setattr(models, '_shared_texts', OrderedDict())
+    monkeypatch.setattr(models, '_shared_texts_bytes', 0)
+    return models._shared_texts
+
+
+def test_share_text_returns_one_copy(shared_texts):
+    first = ''.join(['Backend ', 'role'])
+    second = ''.join(['Backend ', 'role'])
+    assert first is not second
+    assert share_text(first) is first
+    assert share_text(second) is first
+
+
+def test_share_text_is_capped_by_bytes(shared_texts, monkeypatch):
+    size = sys.getsizeof('x' * 1000)
+    monkeypatch.setattr(models, 'MAX_SHARED_TEXT_BYTES', size * 3)
+    monkeypatch.setattr(models, 'MAX_SHARED_TEXT_SIZE', size)
+
+    for letter in 'abcd':
+        share_text(letter * 1000)
+    assert list(shared_texts) == ['b' * 1000, 'c' * 1000, 'd' * 1000]
+    assert models._shared_texts_bytes == size * 3
+
+    # Too large to share: returned as is, nothing evicted
+    big = 'e' * 5000
+    assert share_text(big) is big
+    assert big not in shared_texts and len(shared_texts) == 3
@@ -0,0 +1,192 @@
+import threading
+import time
+
+import pytest
+
+from scheduler import ClassLimits, LLMScheduler, SchedulerRejected, TrafficClass
+
+LIVE, INTERACTIVE, BATCH = TrafficClass.LIVE, TrafficClass.INTERACTIVE, TrafficClass.BATCH
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out waiting for the scheduler'
+        time.sleep(0.001)
+
+
+def queued(scheduler, traffic_class):
+    return scheduler.snapshot()['classes'][traffic_class.name.lower()]['queue_depth']
+
+
+def enqueue_in_order(scheduler, calls, granted):
+    """Queue calls one at a time behind a held slot; each records its grant and releases at once"""
+    threads = []
+    for traffic_class, tenant in calls:
+        def call(traffic_class=traffic_class, tenant=tenant):
+            with scheduler.slot(traffic_class, tenant):
+                granted.append(tenant)
+        depth = queued(scheduler, traffic_class)
+        thread = threading.Thread(target=call)
+        thread.start()
+        wait_for(lambda: queued(scheduler, traffic_class) == depth + 1)
+        threads.append(thread)
+    return threads
+
+
+def test_live_is_served_before_interactive_and_batch():
+    scheduler = LLMScheduler(max_concurrency=1)
+    scheduler.acquire(BATCH, 'holder')
+    granted = []
+    threads = enqueue_in_order(scheduler, [(BATCH, 'batch'), (INTERACTIVE, 'interactive'), (LIVE, 'live')],
+                               granted)
+    scheduler.release(BATCH, 0.0)
+    for thread in threads:
+        thread.join()
+    assert granted == ['live', 'interactive', 'batch']
+
+
+def test_tenants_share_a_class_fairly():
+    scheduler = LLMScheduler(max_concurrency=1)
+    scheduler.acquire(INTERACTIVE, 'holder')
+    granted = []
+    calls = [(INTERACTIVE, 'heavy')] * 4 + [(INTERACTIVE, 'light')] * 2
+    threads = enqueue_in_order(scheduler, calls, granted)
+    scheduler.release(INTERACTIVE, 0.0)
+    for thread in threads:
+        thread.join()
+    assert granted == ['heavy', 'light', 'heavy', 'light', 'heavy', 'heavy']
+
+
+def test_interactive_and_batch_leave_reserved_slots_for_live():
+    scheduler = LLMScheduler(max_concurrency=8)
+    assert scheduler.reserved_live == 2
+    done = threading.Event()
+
+    def hold(traffic_class):
+        with scheduler.slot(traffic_class, 'bulk'):
+            done.wait()
+
+    threads = [threading.Thread(target=hold, args=(traffic_class,))
+               for traffic_class in [INTERACTIVE] * 8 + [BATCH] * 8]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: queued(scheduler, INTERACTIVE) + queued(scheduler, BATCH) == 10)
+    classes = scheduler.snapshot()['classes']
+    assert classes['interactive']['in_flight'] + classes['batch']['in_flight'] == 6
+
+    started = time.monotonic()
+    for _ in range(2):
+        scheduler.acquire(LIVE, 'candidate')  # granted at once from the reserve
+    assert time.monotonic() - started < 0.5
+    assert scheduler.snapshot()['in_flight'] == 8
+
+    for _ in range(2):
+        scheduler.release(LIVE, 0.0)
+    done.set()
+    for thread in threads:
+        thread.join()
+    assert scheduler.snapshot()['in_flight'] == 0
+
+
+def test_without_a_reserve_non_live_traffic_can_fill_every_slot():
+    scheduler = LLMScheduler(max_concurrency=4, reserved_live=0)
+    for _ in range(3):
+        scheduler.acquire(INTERACTIVE, 'a')
+    scheduler.acquire(BATCH, 'b')
+    assert scheduler.snapshot()['in_flight'] == 4
+    assert LLMScheduler(max_concurrency=1).reserved_live == 0
+
+
+def test_full_queue_is_shed_with_retry_after():
+    limits = {BATCH: ClassLimits(max_share=1.0, max_queue=1, max_wait=5.0)}
+    scheduler = LLMScheduler(max_concurrency=2, class_limits=limits)
+    scheduler.acquire(BATCH, 'a')
+    granted = []
+    threads = enqueue_in_order(scheduler, [(BATCH, 'b')], granted)
+
+    with pytest.raises(SchedulerRejected) as error:
+        scheduler.acquire(BATCH, 'c')
+    assert error.value.reason == 'queue_full'
+    assert error.value.retry_after >= 1
+
+    scheduler.release(BATCH, 0.0)
+    for thread in threads:
+        thread.join()
+    assert granted == ['b']
+    assert scheduler.snapshot()['classes']['batch']['shed']['queue_full'] == 1
+
+
+def test_call_waiting_past_the_class_limit_times_out():
+    limits = {INTERACTIVE: ClassLimits(max_share=1.0, max_queue=8, max_wait=0.05)}
+    scheduler = LLMScheduler(max_concurrency=2, class_limits=limits)
+    scheduler.acquire(LIVE, 'candidate')
+    scheduler.acquire(INTERACTIVE, 'a')
+
+    with pytest.raises(SchedulerRejected) as error:
+        scheduler.acquire(INTERACTIVE, 'b')
+    assert error.value.reason == 'timeout'
+
+    # The cancelled ticket does not take the slot when it frees up
+    scheduler.release(INTERACTIVE, 0.0)
+    snapshot = scheduler.snapshot()
+    assert snapshot['in_flight'] == 1
+    assert snapshot['classes']['interactive']['queue_depth'] == 0
+
+
+def test_tenant_quota_applies_to_non_live_calls_only():
+    scheduler = LLMScheduler(max_concurrency=8, tenant_quota_per_minute=60, tenant_quota_burst=2)
+    for _ in range(2):
+        with scheduler.slot(INTERACTIVE, 'acme'):
+            pass
+
+    with pytest.raises(SchedulerRejected) as error:
+        scheduler.acquire(BATCH, 'acme')
+    assert error.value.reason == 'quota'
+    assert error.value.retry_after == 1
+
+    with scheduler.slot(INTERACTIVE, 'other'):
+        pass
+    with scheduler.slot(LIVE, 'acme'):
+        pass
+
+
+def test_idle_tenant_state_is_forgotten():
+    scheduler = LLMScheduler(max_concurrency=4, tenant_quota_per_minute=60000, tenant_quota_burst=1,
+                             max_tenants=8)
+    for index in range(100):
+        with scheduler.slot(INTERACTIVE, f'client-{index}'):
+            pass
+        time.sleep(0.002)  # the bucket refills to full: nothing left to remember
+
+    assert len(scheduler._buckets) <= 9
+    assert all(len(state.tenant_finish) <= 9 for state in scheduler._classes.values())
+
+
+def test_busy_class_keeps_a_bounded_number_of_finish_tags():
+    scheduler = LLMScheduler(max_concurrency=4, max_tenants=8)
+    scheduler.acquire(INTERACTIVE, 'holder')   # keeps the class busy
+    for index in range(50):
+        with scheduler.slot(INTERACTIVE, f'client-{index}'):
+            pass
+    assert len(scheduler._classes[INTERACTIVE].tenant_finish) <= 9
+    scheduler.release(INTERACTIVE, 0.0)
+
+
+def test_batch_keeps_a_slot_under_interactive_load():
+    scheduler = LLMScheduler(max_concurrency=8)
+    for _ in range(6):
+        scheduler.acquire(INTERACTIVE, 'recruiter')   # every non-live slot
+    granted = []
+    threads = enqueue_in_order(scheduler, [(INTERACTIVE, 'tools'), (INTERACTIVE, 'tools'), (BATCH, 'bulk')],
+                               granted)
+
+    scheduler.release(INTERACTIVE, 0.0)
+    wait_for(lambda: granted)
+    assert granted[0] == 'bulk'   # ahead of the queued interactive calls
+
+    for _ in range(5):
+        scheduler.release(INTERACTIVE, 0.0)
+    for thread in threads:
+        thread.join()
+    assert granted == ['bulk', 'tools', 'tools']
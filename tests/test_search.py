@@ -0,0 +1,150 @@
+import os
+import time
+
+import pytest
+
+import search
+from search import CandidateIndex
+from skills import SkillMatcher
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return SkillMatcher()
+
+
+def profile(skills, domain='Backend Engineering', years=3):
+    return {'skills': skills, 'primary_domain': domain, 'experience_years': years, 'projects': []}
+
+
+def test_two_workers_see_each_others_candidates(matcher, tmp_path):
+    path = str(tmp_path / 'index.jsonl')
+    first = CandidateIndex(matcher, path)
+    second = CandidateIndex(matcher, path)
+    assert first.refresh() == second.refresh() == 0
+
+    first.add('a', profile(['Python']))
+    second.add('b', profile(['Go']))
+
+    assert first.refresh() == 1
+    assert second.refresh() == 1
+    assert set(first.profiles) == set(second.profiles) == {'a', 'b'}
+    assert CandidateIndex(matcher, path).refresh() == 2
+
+
+def test_append_after_another_workers_write_is_not_skipped(matcher, tmp_path):
+    path = str(tmp_path / 'index.jsonl')
+    first = CandidateIndex(matcher, path)
+    second = CandidateIndex(matcher, path)
+    assert first.refresh() == second.refresh() == 0
+
+    # second appends between first's last read and first's own write
+    second.add('b', profile(['Go']))
+    first.add('a', profile(['Python']))
+    second.add('c', profile(['Rust']))
+
+    assert first.refresh() == 2
+    assert set(first.profiles) == {'a', 'b', 'c'}
+    assert second.refresh() == 1
+    assert first.refresh() == 0
+
+
+def test_write_racing_another_worker_keeps_its_line(matcher, tmp_path, monkeypatch):
+    path = str(tmp_path / 'index.jsonl')
+    first = CandidateIndex(matcher, path)
+    second = CandidateIndex(matcher, path)
+    assert first.refresh() == second.refresh() == 0
+    real_write = os.write
+
+    def write_after_other_worker(fd, data):
+        # Another worker's line lands right before ours
+        monkeypatch.setattr(os, 'write', real_write)
+        second.add('b', profile(['Go']))
+        return real_write(fd, data)
+
+    monkeypatch.setattr(os, 'write', write_after_other_worker)
+    first.add('a', profile(['Python']))
+
+    assert first.refresh() == 1
+    assert set(first.profiles) == {'a', 'b'}
+    assert second.refresh() == 1
+
+
+def test_construction_does_not_touch_the_log(matcher, tmp_path):
+    path = str(tmp_path / 'data' / 'index.jsonl')
+    index = CandidateIndex(matcher, path)
+    assert not os.path.exists(os.path.dirname(path))
+
+    index.add('a', profile(['Python']))
+    assert 'a' in CandidateIndex(matcher, path)
+
+
+def test_deletion_reaches_other_workers_and_restarts(matcher, tmp_path):
+    path = str(tmp_path / 'index.jsonl')
+    first = CandidateIndex(matcher, path)
+    second = CandidateIndex(matcher, path)
+    first.add('a', profile(['Python']))
+    first.add('b', profile(['Go']))
+
+    assert 'a' in second
+    assert second.remove('a')
+    assert not second.remove('a')
+
+    first.refresh()
+    assert set(first.profiles) == {'b'}
+    assert first.search(skills=['Python']) == ([], 0)
+    restarted = CandidateIndex(matcher, path)
+    assert 'a' not in restarted and 'b' in restarted
+
+
+def test_compaction_drops_dead_lines_and_other_workers_reload(matcher, tmp_path, monkeypatch):
+    monkeypatch.setattr(search, 'COMPACT_MIN_DEAD_LINES', 3)
+    path = str(tmp_path / 'index.jsonl')
+    first = CandidateIndex(matcher, path)
+    second = CandidateIndex(matcher, path)
+    second.add('keep', profile(['Go']))
+    for _ in range(4):
+        first.add('a', profile(['Python']))
+        first.remove('a')
+
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert len(lines) == len(CandidateIndex(matcher, path)) == 1
+
+    # second's offset pointed into the old file; it rebuilds from the new one
+    second.add('new', profile(['Rust']))
+    second.refresh()
+    assert set(second.profiles) == {'keep', 'new'}
+    first.refresh()
+    assert set(first.profiles) == {'keep', 'new'}
+
+
+def test_profiles_older_than_max_age_expire(matcher, tmp_path, monkeypatch):
+    path = str(tmp_path / 'index.jsonl')
+    index = CandidateIndex(matcher, path, max_age=60)
+    index.add('old', profile(['Python']))
+
+    later = time.time() + 2 * search.EXPIRE_INTERVAL
+    monkeypatch.setattr(time, 'time', lambda: later)
+    index.add('new', profile(['Go']))
+    assert set(index.profiles) == {'new'}
+
+    restarted = CandidateIndex(matcher, path, max_age=60)
+    assert 'old' not in restarted and 'new' in restarted
+
+
+def test_unmatched_query_terms_return_nothing(matcher):
+    index = CandidateIndex(matcher)
+    index.add('a', profile(['Python'], years=2))
+    index.add('b', profile(['Go', 'Python'], years=6))
+
+    assert index.search(skills=['Salesforce']) == ([], 0)
+    assert index.search(job_description='Sales representative for retail accounts') == ([], 0)
+
+    results, total = index.search(skills=['Go', 'Python'])
+    assert total == 2
+    assert [result['candidate_id'] for result in results] == ['b', 'a']
+    assert results[1]['missing_skills'] == ['Go']
+
+    results, total = index.search(skills=['Python'], min_experience=5)
+    assert [result['candidate_id'] for result in results] == ['b']
@@ -0,0 +1,56 @@
+import pytest
+
+from skills import SkillMatcher, skill_overlap
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return SkillMatcher()
+
+
+@pytest.mark.parametrize('text', [
+    'I excel at delivering swift results for Oracle clients',
+    'Holds TS clearance; ML research; a spark of curiosity',
+    'Go to market strategy, grade C average, R&D budget',
+    'We react quickly to incidents; a flask of tea',
+    'Rails and helm of the ship',
+])
+def test_common_words_are_not_skills(matcher, text):
+    assert matcher.extract(text) == []
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Skills: Go, Python, C, R', ['Go', 'Python', 'C', 'R']),
+    ('Experience with Go and Rust', ['Go', 'Rust']),
+    ('- Excel\n- SQL', ['Excel', 'SQL']),
+    ('react, node.js, flask', ['React', 'Node.js', 'Flask']),
+    ('Built dashboards in React and TypeScript', ['React', 'TypeScript']),
+    ('Used k8s and Postgres', ['Kubernetes', 'PostgreSQL']),
+    ('SQL Server', ['SQL Server']),
+    ('Ruby on Rails', ['Ruby on Rails']),
+    ('GitHub Actions', ['GitHub Actions']),
+    ('React Native', ['React Native']),
+    ('Skills: React, SQL, Ruby', ['React', 'SQL', 'Ruby']),
+])
+def test_listed_skills_are_found(matcher, text, expected):
+    assert matcher.extract(text) == expected
+
+
+def test_prose_word_does_not_count_towards_the_match(matcher):
+    overlap = skill_overlap(matcher, 'I excel at Python scripting', 'Requirements: Excel, Python')
+    assert overlap['matched_skills'] == ['Python']
+    assert overlap['missing_skills'] == ['Excel']
+    assert overlap['skill_match_percentage'] == 50
+
+
+def test_longest_alias_wins_in_the_overlap(matcher):
+    overlap = skill_overlap(matcher, 'Skills: mssql, Kubernetes', 'Requirements: SQL Server, Kubernetes')
+    assert overlap['jd_skills'] == ['SQL Server', 'Kubernetes']
+    assert overlap['missing_skills'] == []
+    assert overlap['skill_match_percentage'] == 100
+
+
+def test_no_recognized_jd_skills_is_not_zero_percent(matcher):
+    overlap = skill_overlap(matcher, 'Python developer', 'Salesforce administrator with Apex')
+    assert overlap['jd_skills'] == []
+    assert overlap['skill_match_percentage'] is None